@@ -61,6 +61,9 @@ DEFAULT_CONFIG = {
     "log_to_sd_card": False,           # Use SD card if available
     "log_format_csv": True,            # CSV format
     "log_format_json": False,          # JSON Lines format
+    "log_format_bin": False,           # Packed binary records (20 bytes each)
+    "log_compress": False,             # gzip CSV/JSON logs (needs deflate module);
+                                       # the open .gz log is lost on watchdog reset or power loss
     "log_circular_buffer": True,       # Overwrite oldest when full
     "auto_upload_logs": True,          # Upload logs after connection recovery
 
@@ -301,6 +304,7 @@ class Pins:
 
     # Power Control
     GPS_ENABLE = 28        # GPS module power enable (not used with SIM7080G)
+    CELL_ENABLE = None     # Cellular power enable (modem uses CELL_PWR key instead)
 
 
 # ==============================================================================
@@ -398,6 +402,14 @@ class ConfigManager:
 
     def __init__(self):
         self.config = DEFAULT_CONFIG.copy()
+
+        # Nesting depth of begin_batch() and whether a save was deferred
+        self._batch_depth = 0
+        self._save_pending = False
+
+        # Bumped on every change so callers can refresh cached values
+        self.version = 0
+
         self.load()
 
     def load(self):
@@ -406,11 +418,20 @@ class ConfigManager:
             with open(self.CONFIG_FILE, 'r') as f:
                 saved = json.load(f)
                 self.config.update(saved)
+                self.version += 1
         except (OSError, ValueError):
             pass
 
     def save(self):
-        """Save configuration to flash storage."""
+        """Save configuration to flash storage.
+
+        Inside begin_batch()/commit_batch() the write is deferred until
+        the outermost commit_batch().
+        """
+        if self._batch_depth:
+            self._save_pending = True
+            return True
+
         try:
             with open(self.CONFIG_FILE, 'w') as f:
                 json.dump(self.config, f)
@@ -423,16 +444,77 @@ class ConfigManager:
         return self.config.get(key, default)
 
     def set(self, key, value):
-        """Set a configuration value."""
-        self.config[key] = value
+        """Set a configuration value.
+
+        A value of a different type counts as a change even when it
+        compares equal (True vs 1, 1 vs 1.0), so the new type is saved.
+
+        Returns:
+            bool: True if the stored value changed
+        """
+        config = self.config
+        if (key in config and type(config[key]) is type(value) and
+                config[key] == value):
+            return False
+        config[key] = value
+        self.version += 1
+        return True
 
     def update(self, updates):
-        """Update multiple configuration values."""
-        self.config.update(updates)
+        """Update multiple configuration values.
+
+        Returns:
+            bool: True if any stored value changed
+        """
+        changed = False
+        for key, value in updates.items():
+            if self.set(key, value):
+                changed = True
+        return changed
+
+    def begin_batch(self):
+        """Start a batch of changes saved with a single flash write."""
+        self._batch_depth += 1
+
+    def commit_batch(self):
+        """End a batch, writing to flash once if any save() was requested.
+
+        Returns:
+            bool: False if the deferred save failed
+        """
+        if self._batch_depth:
+            self._batch_depth -= 1
+        if self._batch_depth or not self._save_pending:
+            return True
+        self._save_pending = False
+        return self.save()
+
+    def transaction(self):
+        """Batch changes in a with block, saving once at the end.
+
+        There is no rollback: set() changes the config immediately, so if
+        the block raises, the changes made before the exception are still
+        saved (if save() was requested) and the exception propagates.
+
+        Usage:
+            with config.transaction():
+                config.set("rf_mode", "auto")
+                config.save()
+        """
+        return self
+
+    def __enter__(self):
+        self.begin_batch()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.commit_batch()
+        return False
 
     def reset(self):
         """Reset to default configuration."""
         self.config = DEFAULT_CONFIG.copy()
+        self.version += 1
         self.save()
 
     def get_cinet_key_bytes(self):
@@ -4,6 +4,35 @@
 from machine import UART, Pin
 import time
 
+try:
+    import micropython
+except ImportError:
+    # Host Python: the code emitter decorators become no-ops
+    class micropython:
+        native = staticmethod(lambda f: f)
+        viper = staticmethod(lambda f: f)
+
+    ptr8 = bytearray
+
+
+@micropython.viper
+def _nmea_scan(buf: ptr8, n: int) -> int:
+    """Find the checksum of the NMEA sentence in buf[0:n].
+
+    Returns:
+        int: (index of '*') << 8 | XOR of the bytes between '$' and '*',
+             or -1 if the sentence has no '*'
+    """
+    c = 0
+    i = 1
+    while i < n:
+        b = buf[i]
+        if b == 42:  # '*'
+            return (i << 8) | c
+        c ^= b
+        i += 1
+    return -1
+
 
 class GPSDriver:
     """Driver for NMEA GPS modules (NEO-6M, NEO-M8N, etc.)."""
@@ -44,6 +73,9 @@ class GPSDriver:
         self._buffer = bytearray(128)
         self._buf_idx = 0
 
+        # UART read chunk, refilled in place by update()
+        self._rx = bytearray(64)
+
     def update(self):
         """Read and parse available GPS data.
 
@@ -53,36 +85,69 @@ class GPSDriver:
             bool: True if new valid position data was received
         """
         new_fix = False
-
-        while self.uart.any():
-            byte = self.uart.read(1)
-            if byte is None:
+        rx = self._rx
+        buf = self._buffer
+        limit = len(buf) - 1
+
+        while True:
+            # Read whatever is buffered, a chunk at a time, without waiting
+            avail = self.uart.any()
+            if not avail:
+                break
+            n = self.uart.readinto(rx, min(avail, len(rx)))
+            if not n:
                 break
 
-            char = byte[0]
+            for i in range(n):
+                char = rx[i]
 
-            if char == ord('$'):
-                # Start of new sentence
-                self._buf_idx = 0
-                self._buffer[self._buf_idx] = char
-                self._buf_idx += 1
+                if char == 0x24:  # '$'
+                    # Start of new sentence
+                    buf[0] = char
+                    self._buf_idx = 1
 
-            elif char == ord('\n') or char == ord('\r'):
-                # End of sentence
-                if self._buf_idx > 0:
-                    sentence = bytes(self._buffer[:self._buf_idx]).decode('ascii', 'ignore')
-                    if self._parse_sentence(sentence):
-                        new_fix = True
-                    self._buf_idx = 0
+                elif char == 0x0A or char == 0x0D:  # '\n' / '\r'
+                    # End of sentence
+                    if self._buf_idx > 0:
+                        end = self._checked_length(self._buf_idx)
+                        if end:
+                            sentence = bytes(buf[:end]).decode('ascii', 'ignore')
+                            if self._parse_sentence(sentence):
+                                new_fix = True
+                        self._buf_idx = 0
 
-            elif self._buf_idx < len(self._buffer) - 1:
-                self._buffer[self._buf_idx] = char
-                self._buf_idx += 1
+                elif self._buf_idx < limit:
+                    buf[self._buf_idx] = char
+                    self._buf_idx += 1
 
         return new_fix
 
+    def _checked_length(self, n):
+        """Verify the checksum of the sentence in the receive buffer.
+
+        The XOR runs over the raw bytes (see _nmea_scan) before anything
+        is decoded, so corrupt sentences never allocate a string.
+
+        Args:
+            n: Number of bytes in the receive buffer
+
+        Returns:
+            int: Sentence length without the checksum, or 0 if it failed
+        """
+        scan = _nmea_scan(self._buffer, n)
+        if scan < 0:
+            return n
+
+        star = scan >> 8
+        try:
+            expected = int(bytes(self._buffer[star + 1:star + 3]), 16)
+        except ValueError:
+            # Unreadable checksum field: accept the sentence as before
+            return star
+        return star if (scan & 0xFF) == expected else 0
+
     def _parse_sentence(self, sentence):
-        """Parse an NMEA sentence.
+        """Parse an NMEA sentence (checksum already stripped and verified).
 
         Returns:
             bool: True if this was a position sentence with valid data
@@ -90,20 +155,6 @@ class GPSDriver:
         if not sentence.startswith('$'):
             return False
 
-        # Verify checksum if present
-        if '*' in sentence:
-            data, checksum_str = sentence[1:].split('*', 1)
-            try:
-                expected = int(checksum_str[:2], 16)
-                actual = 0
-                for c in data:
-                    actual ^= ord(c)
-                if actual != expected:
-                    return False
-            except (ValueError, IndexError):
-                pass
-            sentence = '$' + data
-
         parts = sentence.split(',')
         msg_type = parts[0][3:] if len(parts[0]) > 3 else ''
 
@@ -318,6 +369,35 @@ class GPSDriver:
                           self.hour, self.minute, self.second)
         }
 
+    def get_position_into(self, d):
+        """Fill a caller-owned dict with the data get_position() returns.
+
+        'timestamp' is kept as a 6-element list updated in place, so
+        reusing the same dict allocates no new containers.
+
+        Returns:
+            dict: d
+        """
+        d['latitude'] = self.latitude
+        d['longitude'] = self.longitude
+        d['altitude'] = self.altitude
+        d['speed'] = self.speed_kmh
+        d['heading'] = self.heading
+        d['hdop'] = self.hdop
+        d['satellites'] = self.satellites
+        d['valid'] = self.valid
+
+        ts = d.get('timestamp')
+        if ts is None:
+            ts = d['timestamp'] = [0] * 6
+        ts[0] = self.year
+        ts[1] = self.month
+        ts[2] = self.day
+        ts[3] = self.hour
+        ts[4] = self.minute
+        ts[5] = self.second
+        return d
+
     def wait_for_fix(self, timeout_sec=60, callback=None):
         """Wait for a GPS fix.
 
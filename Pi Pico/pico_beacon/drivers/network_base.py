@@ -38,7 +38,7 @@ class NetworkDriverBase:
         """
         raise NotImplementedError
 
-    def send_tcp(self, host, port, data, timeout_ms=10000):
+    def send_tcp(self, host, port, data, timeout_ms=10000, keepalive=False):
         """Send data via TCP.
 
         Args:
@@ -46,6 +46,8 @@ class NetworkDriverBase:
             port: Server port
             data: bytes or bytearray to send
             timeout_ms: Connection timeout in milliseconds
+            keepalive: Keep the connection open for the next send to the
+                same host/port instead of closing it
 
         Returns:
             bool: True if sent successfully
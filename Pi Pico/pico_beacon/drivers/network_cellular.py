@@ -1,15 +1,34 @@
 # Cellular Network Driver
 # Handles SIM7600/SIM800L GSM/LTE modules via AT commands
 
-from machine import UART, Pin
+from machine import UART, Pin, Timer
 import time
 
+try:
+    import select
+except ImportError:
+    import uselect as select
+
 from .network_base import NetworkDriverBase
 
 
 class CellularDriver(NetworkDriverBase):
     """Cellular network driver for SIM7600/SIM800L modules."""
 
+    # How long after a successful AT exchange is_connected() trusts the
+    # PDP context without re-querying AT+CGACT?
+    LINK_FRESH_MS = 5000
+
+    # Short replies (AT, ATE0, AT+CSQ) arrive as one burst within a few ms
+    # of the command; waiting this long first lets one read get all of it
+    FAST_PATH_MS = 5
+
+    # Power key timing (ms)
+    PWR_ON_PULSE_MS = 1000
+    PWR_ON_BOOT_MS = 3000
+    PWR_OFF_DELAY_MS = 1000
+    PWR_OFF_PULSE_MS = 2000
+
     def __init__(self, uart_id=1, tx_pin=4, rx_pin=5, pwr_pin=6,
                  baudrate=115200, apn="internet", user="", password=""):
         """Initialize cellular driver.
@@ -26,32 +45,78 @@ class CellularDriver(NetworkDriverBase):
         """
         super().__init__()
 
+        # 1 KB RX ring holds a full AT response plus URCs, so one readinto()
+        # usually gets it all without overruns (costs ~1 KB of RAM).
+        # Reads are sized by any(), so timeout/timeout_char only bound how
+        # long a short read may block.
         self.uart = UART(uart_id, baudrate=baudrate,
-                         tx=Pin(tx_pin), rx=Pin(rx_pin))
+                         tx=Pin(tx_pin), rx=Pin(rx_pin),
+                         rxbuf=1024, timeout=50, timeout_char=10)
 
         self.pwr_pin = Pin(pwr_pin, Pin.OUT) if pwr_pin is not None else None
-        self.apn = apn
-        self.user = user
-        self.password = password
+
+        # Power key pulses are timed by a one-shot timer so power_on()
+        # returns immediately; _pwr_deadline is when the module is usable
+        self._pwr_timer = Timer(-1) if pwr_pin is not None else None
+        self._pwr_pulse_ms = 0
+        self._pwr_deadline = None
+        self.set_apn(apn, user, password)
 
         # Module state
         self._registered = False
         self._pdp_active = False
         self._rssi = 0
-        self._operator = ""
+        self._operator = b""
         self._lac = 0
         self._cell_id = 0
 
+        # ticks_ms of the last command answered with its expected response
+        self._last_ok_ms = None
+
+        # +CREG result format currently set on the module (2 = with LAC/CI)
+        self._creg_mode = 0
+
+        # AT command set for TCP/UDP: "sim7600", "sim800" or "" (unknown,
+        # try both); detected from ATI in init_module
+        self._at_dialect = ""
+
+        # Host/port of the TCP connection left open by send_tcp(keepalive=True)
+        self._tcp_peer = None
+
+        # SEND OK still owed by a send_tcp(wait_ack=False); consumed before
+        # the next command is written
+        self._pending_send_ok = False
+        self._ack_timeout_ms = 0
+
+        # Reusable response buffer filled with readinto (see _wait_response)
+        self._rxbuf = bytearray(512)
+        self._rxmv = memoryview(self._rxbuf)
+
+        # Block on UART readability instead of sleeping between polls
+        try:
+            self._poll = select.poll()
+            self._poll.register(self.uart, select.POLLIN)
+        except (AttributeError, OSError, TypeError):
+            # No poll support, or a UART object poll() cannot watch
+            self._poll = None
+
     def power_on(self):
-        """Power on the cellular module."""
+        """Power on the cellular module.
+
+        Starts the power key pulse and returns without waiting for the
+        module to boot; init_module() waits for the remaining boot time.
+        """
         if self.pwr_pin is None:
             return
 
-        # Pulse power key
-        self.pwr_pin.value(1)
-        time.sleep(1.0)
-        self.pwr_pin.value(0)
-        time.sleep(3.0)  # Wait for module to boot
+        self._wait_power()
+
+        # Pulse power key; the timer releases it
+        self._pwr_key_press()
+        self._pwr_timer.init(mode=Timer.ONE_SHOT, period=self.PWR_ON_PULSE_MS,
+                             callback=self._pwr_key_release)
+        self._pwr_deadline = time.ticks_add(
+            time.ticks_ms(), self.PWR_ON_PULSE_MS + self.PWR_ON_BOOT_MS)
 
     def power_off(self):
         """Power off the cellular module."""
@@ -59,47 +124,216 @@ class CellularDriver(NetworkDriverBase):
         self._send_at("AT+CPOF", timeout_ms=5000)
 
         if self.pwr_pin:
-            time.sleep(1.0)
-            self.pwr_pin.value(1)
-            time.sleep(2.0)
-            self.pwr_pin.value(0)
+            self._wait_power()
+
+            # Pulse power key after a delay; both steps run from the timer
+            self._pwr_pulse_ms = self.PWR_OFF_PULSE_MS
+            self._pwr_timer.init(mode=Timer.ONE_SHOT, period=self.PWR_OFF_DELAY_MS,
+                                 callback=self._pwr_key_press)
+            self._pwr_deadline = time.ticks_add(
+                time.ticks_ms(), self.PWR_OFF_DELAY_MS + self.PWR_OFF_PULSE_MS)
+
+    def _pwr_key_press(self, _timer=None):
+        """Assert the power key, releasing it after _pwr_pulse_ms if set."""
+        self.pwr_pin.value(1)
+        if self._pwr_pulse_ms:
+            self._pwr_timer.init(mode=Timer.ONE_SHOT, period=self._pwr_pulse_ms,
+                                 callback=self._pwr_key_release)
+            self._pwr_pulse_ms = 0
+
+    def _pwr_key_release(self, _timer=None):
+        """Release the power key."""
+        self.pwr_pin.value(0)
+
+    def _wait_power(self):
+        """Block until a pending power key sequence has finished."""
+        if self._pwr_deadline is None:
+            return
+        remaining = time.ticks_diff(self._pwr_deadline, time.ticks_ms())
+        if remaining > 0:
+            time.sleep_ms(remaining)
+        self._pwr_deadline = None
+
+    def _mkcmd(self, *parts):
+        """Assemble an AT command from bytes parts.
+
+        Args:
+            *parts: bytes fragments of the command line
+
+        Returns:
+            bytes: Command terminated with CRLF, ready for _send_at
+        """
+        return b"".join(parts) + b"\r\n"
+
+    def _write_cmd(self, command):
+        """Write an AT command to the UART.
+
+        Args:
+            command: AT command string, or CRLF-terminated bytes from _mkcmd
+        """
+        if isinstance(command, str):
+            command = (command + "\r\n").encode()
+        self.uart.write(command)
 
-    def _send_at(self, command, timeout_ms=1000, expect="OK"):
+    def _send_at(self, command, timeout_ms=1000, expect=b"OK"):
         """Send AT command and wait for response.
 
         Args:
-            command: AT command string
+            command: AT command string, or bytes built with _mkcmd
             timeout_ms: Response timeout in milliseconds
-            expect: Expected response string (or None for any)
+            expect: Expected response bytes (or None for any)
 
         Returns:
-            tuple: (success: bool, response: str)
+            tuple: (success: bool, response: bytes)
         """
-        # Clear any pending data
-        while self.uart.any():
-            self.uart.read()
+        if self._pending_send_ok:
+            self._consume_send_ok()
+
+        # Discard stale data (sized read so it returns without waiting
+        # out timeout_char)
+        pending = self.uart.any()
+        if pending:
+            self.uart.read(pending)
 
         # Send command
-        self.uart.write((command + "\r\n").encode())
+        self._write_cmd(command)
 
-        # Read response
-        response = ""
-        start = time.ticks_ms()
+        return self._wait_response(expect, timeout_ms, settle_ms=self.FAST_PATH_MS)
 
-        while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
-            if self.uart.any():
-                data = self.uart.read()
-                if data:
-                    response += data.decode('ascii', 'ignore')
+    def _wait_response(self, expect, timeout_ms, poll_ms=10, settle_ms=0):
+        """Read UART until the expected bytes or ERROR are seen.
+
+        The response is never decoded here; callers decode only the
+        fields they surface (see get_operator, get_ip_address).
+
+        Args:
+            expect: Expected response bytes (or None for any)
+            timeout_ms: Response timeout in milliseconds
+            poll_ms: Sleep between empty UART polls when select.poll
+                is unavailable for the UART
+            settle_ms: Initial wait so a short reply is complete before
+                the first read
+
+        Returns:
+            tuple: (success: bool, response: bytes)
+        """
+        rxlen = 0
+
+        # Local bindings avoid repeated global/attribute lookups per pass
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        uart_any = self.uart.any
+        uart_readinto = self.uart.readinto
+        poller = self._poll
+
+        start = ticks_ms()
+
+        # Fast path: after the settle time a short reply is usually whole,
+        # so the first pass below returns without polling or sleeping
+        if settle_ms:
+            time.sleep_ms(settle_ms)
+
+        while ticks_diff(ticks_ms(), start) < timeout_ms:
+            avail = uart_any()
+            if avail:
+                while rxlen + avail > len(self._rxbuf):
+                    self._grow_rxbuf(rxlen)
+
+                n = uart_readinto(self._rxmv[rxlen:rxlen + avail])
+                if n:
+                    rxlen += n
+                    # Search the bytearray itself: `in` on a memoryview
+                    # compares elements, never a byte substring
+                    rxbuf = self._rxbuf
+
+                    if expect and rxbuf.find(expect, 0, rxlen) >= 0:
+                        self._last_ok_ms = ticks_ms()
+                        return (True, bytes(self._rxmv[:rxlen]))
+                    if rxbuf.find(b"ERROR", 0, rxlen) >= 0:
+                        return (False, bytes(self._rxmv[:rxlen]))
+
+            if poller is not None:
+                remaining = timeout_ms - ticks_diff(ticks_ms(), start)
+                if remaining > 0:
+                    poller.poll(remaining)
+            elif poll_ms:
+                time.sleep_ms(poll_ms)
+
+        ok = expect is None or self._rxbuf.find(expect, 0, rxlen) >= 0
+        if ok and rxlen:
+            self._last_ok_ms = ticks_ms()
+        return (ok, bytes(self._rxmv[:rxlen]))
+
+    def _grow_rxbuf(self, rxlen):
+        """Double the response buffer, keeping the first rxlen bytes.
+
+        Args:
+            rxlen: Number of bytes already received
+        """
+        buf = bytearray(len(self._rxbuf) * 2)
+        buf[:rxlen] = self._rxmv[:rxlen]
+        self._rxbuf = buf
+        self._rxmv = memoryview(buf)
+
+    def _consume_send_ok(self):
+        """Wait for the SEND OK left over from send_tcp(wait_ack=False).
+
+        Returns:
+            bool: True if the deferred send was confirmed
+        """
+        self._pending_send_ok = False
+        ok, resp = self._wait_response(b"SEND OK", self._ack_timeout_ms)
+        if not ok:
+            self._last_error = f"Send failed: {resp.decode('ascii', 'ignore')}"
+            # Link state is unknown; reopen on the next send
+            self._tcp_peer = None
+        return ok
+
+    def _send_and_wait(self, payload, expect=b"SEND OK", timeout_ms=10000):
+        """Write a data payload after the '>' prompt and wait for its result.
+
+        Unlike _send_at("") this neither drains the UART (which could drop
+        an early SEND OK) nor writes an empty command line.
+
+        Args:
+            payload: bytes or bytearray to write
+            expect: Expected response bytes
+            timeout_ms: Response timeout in milliseconds
+
+        Returns:
+            tuple: (success: bool, response: bytes)
+        """
+        self.uart.write(payload)
+        return self._wait_response(expect, timeout_ms)
+
+    def _send_batch(self, commands):
+        """Send a sequence of AT commands one after another.
+
+        Commands run sequentially: each is written once the previous one
+        has answered (or timed out). Unlike calling _send_at per command,
+        the UART is drained once up front and no settle delay is paid
+        before each reply.
+
+        Args:
+            commands: list of (command, timeout_ms, expect) tuples
+
+        Returns:
+            list: (success, response) tuple for each command
+        """
+        if self._pending_send_ok:
+            self._consume_send_ok()
 
-                    if expect and expect in response:
-                        return (True, response)
-                    if "ERROR" in response:
-                        return (False, response)
+        # Discard stale data
+        pending = self.uart.any()
+        if pending:
+            self.uart.read(pending)
 
-            time.sleep_ms(10)
+        results = []
+        for command, timeout_ms, expect in commands:
+            self._write_cmd(command)
+            results.append(self._wait_response(expect, timeout_ms))
 
-        return (expect is None or expect in response, response)
+        return results
 
     def init_module(self):
         """Initialize the cellular module.
@@ -107,22 +341,36 @@ class CellularDriver(NetworkDriverBase):
         Returns:
             bool: True if initialization successful
         """
+        # Let a power_on() still in progress finish booting
+        self._wait_power()
+
         # Test AT communication
         ok, _ = self._send_at("AT", timeout_ms=2000)
         if not ok:
             self._last_error = "Module not responding"
             return False
 
-        # Disable echo
-        self._send_at("ATE0")
+        # Module may have been reset, so +CREG format is back to default
+        self._creg_mode = 0
+
+        # Disable echo and set full functionality
+        self._send_batch([
+            ("ATE0", 1000, b"OK"),
+            ("AT+CFUN=1", 5000, b"OK"),
+        ])
 
-        # Set full functionality
-        self._send_at("AT+CFUN=1", timeout_ms=5000)
+        # Identify the module so send_tcp/send_udp use one command set
+        ok, resp = self._send_at("ATI")
+        if ok:
+            if b"SIM800" in resp:
+                self._at_dialect = "sim800"
+            elif b"SIM7600" in resp:
+                self._at_dialect = "sim7600"
 
         # Wait for SIM ready
         for _ in range(10):
             ok, resp = self._send_at("AT+CPIN?", timeout_ms=2000)
-            if "READY" in resp:
+            if b"READY" in resp:
                 break
             time.sleep(1)
         else:
@@ -149,7 +397,7 @@ class CellularDriver(NetworkDriverBase):
         # Wait for network registration
         while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
             ok, resp = self._send_at("AT+CREG?")
-            if ",1" in resp or ",5" in resp:  # Home or roaming
+            if b",1" in resp or b",5" in resp:  # Home or roaming
                 self._registered = True
                 break
             time.sleep(1)
@@ -158,14 +406,17 @@ class CellularDriver(NetworkDriverBase):
             self._last_error = "Network registration failed"
             return False
 
+        # Report LAC/Cell ID in +CREG? from now on
+        self._set_creg_mode()
+
         # Configure APN (for SIM7600)
-        self._send_at(f'AT+CGDCONT=1,"IP","{self.apn}"')
+        self._send_at(self._cgdcont_cmd)
 
         # Activate PDP context
         ok, resp = self._send_at("AT+CGACT=1,1", timeout_ms=30000)
         if not ok:
             # Try alternative method (for SIM800L)
-            self._send_at(f'AT+CSTT="{self.apn}","{self.user}","{self.password}"')
+            self._send_at(self._cstt_cmd)
             ok, resp = self._send_at("AT+CIICR", timeout_ms=30000)
             if not ok:
                 self._last_error = "PDP activation failed"
@@ -183,6 +434,8 @@ class CellularDriver(NetworkDriverBase):
     def disconnect(self):
         """Disconnect from cellular network."""
         self._send_at("AT+CGACT=0,1", timeout_ms=5000)
+        self._tcp_peer = None
+        self._last_ok_ms = None
         self._pdp_active = False
         self._connected = False
         self._registered = False
@@ -196,16 +449,67 @@ class CellularDriver(NetworkDriverBase):
         if not self._pdp_active:
             return False
 
+        # Module answered recently: assume the context is still up
+        if (self._connected and self._last_ok_ms is not None and
+                time.ticks_diff(time.ticks_ms(), self._last_ok_ms) < self.LINK_FRESH_MS):
+            return True
+
         # Check PDP context status
         ok, resp = self._send_at("AT+CGACT?")
-        if ok and "+CGACT: 1,1" in resp:
+        if ok and b"+CGACT: 1,1" in resp:
             self._connected = True
             return True
 
         self._connected = False
         return False
 
-    def send_tcp(self, host, port, data, timeout_ms=10000):
+    def _close_tcp(self):
+        """Close the TCP connection on link 0."""
+        self._send_at("AT+CIPCLOSE=0", timeout_ms=5000)
+        self._tcp_peer = None
+
+    def _tcp_link_closed(self):
+        """Check buffered URCs for the server closing the kept-alive link.
+
+        The modem reports a remote close unprompted ("CLOSED" on SIM800,
+        "+IPCLOSE:" on SIM7600). The URC waits in the UART buffer until
+        the next command drains it, so it is read here before the link is
+        reused; a send on the closed link would otherwise be lost.
+
+        Returns:
+            bool: True if the link is known to be closed
+        """
+        if self._pending_send_ok and not self._consume_send_ok():
+            return True
+        pending = self.uart.any()
+        if not pending:
+            return False
+        urcs = self.uart.read(pending) or b""
+        return b"CLOSED" in urcs or b"+IPCLOSE" in urcs
+
+    def _request_prompt(self, len_b):
+        """Issue AT+CIPSEND for the detected dialect and wait for '>'.
+
+        Args:
+            len_b: Payload length as ASCII bytes
+
+        Returns:
+            bool: True if the data prompt was received
+        """
+        if self._at_dialect != "sim800":
+            # SIM7600 style
+            cmd = self._mkcmd(b"AT+CIPSEND=0,", len_b)
+            ok, _ = self._send_at(cmd, timeout_ms=5000, expect=b">")
+            if ok or self._at_dialect:
+                return ok
+
+        # SIM800L style
+        cmd = self._mkcmd(b"AT+CIPSEND=", len_b)
+        ok, _ = self._send_at(cmd, timeout_ms=5000, expect=b">")
+        return ok
+
+    def send_tcp(self, host, port, data, timeout_ms=10000, keepalive=False,
+                 wait_ack=True):
         """Send data via TCP using AT commands.
 
         Args:
@@ -213,51 +517,82 @@ class CellularDriver(NetworkDriverBase):
             port: Server port
             data: bytes or bytearray to send
             timeout_ms: Timeout in milliseconds
+            keepalive: Reuse an open connection to host/port and leave it
+                open afterwards instead of sending AT+CIPCLOSE. A link the
+                server has closed is reopened before sending
+            wait_ack: Wait for SEND OK before returning. If False and
+                keepalive is True, return once the data is written; the
+                SEND OK is consumed before the next AT command and a
+                failure lands in last_error. Ignored without keepalive,
+                since AT+CIPCLOSE has to wait for the SEND OK anyway
 
         Returns:
-            bool: True if sent successfully
+            bool: True if sent successfully (written, if wait_ack=False)
         """
         if not self._connected:
             self._last_error = "Not connected"
             return False
 
-        # Start TCP connection (SIM7600 style)
-        cmd = f'AT+CIPOPEN=0,"TCP","{host}",{port}'
-        ok, resp = self._send_at(cmd, timeout_ms=timeout_ms, expect="CONNECT OK")
+        peer = (host, port)
+        host_b = host.encode()
+        port_b = str(port).encode()
+
+        if self._tcp_peer is not None:
+            if self._tcp_peer != peer:
+                self._close_tcp()
+            elif self._tcp_link_closed():
+                # Dropped by the server; open a fresh link below
+                self._tcp_peer = None
+
+        reused = self._tcp_peer is not None
+        if not reused:
+            ok = False
+            if self._at_dialect != "sim800":
+                # Start TCP connection (SIM7600 style)
+                cmd = self._mkcmd(b'AT+CIPOPEN=0,"TCP","', host_b, b'",', port_b)
+                ok, resp = self._send_at(cmd, timeout_ms=timeout_ms, expect=b"CONNECT OK")
+
+            if not ok and self._at_dialect != "sim7600":
+                # SIM800L style
+                cmd = self._mkcmd(b'AT+CIPSTART="TCP","', host_b, b'","', port_b, b'"')
+                ok, resp = self._send_at(cmd, timeout_ms=timeout_ms, expect=b"CONNECT")
 
-        if not ok and "CONNECT OK" not in resp:
-            # Try SIM800L style
-            cmd = f'AT+CIPSTART="TCP","{host}","{port}"'
-            ok, resp = self._send_at(cmd, timeout_ms=timeout_ms, expect="CONNECT")
             if not ok:
-                self._last_error = f"TCP connect failed: {resp}"
+                self._last_error = f"TCP connect failed: {resp.decode('ascii', 'ignore')}"
                 return False
 
-        # Send data
-        data_len = len(data)
-
-        # Enter data mode (SIM7600)
-        ok, resp = self._send_at(f"AT+CIPSEND=0,{data_len}", timeout_ms=5000, expect=">")
-        if not ok:
-            # Try SIM800L style
-            ok, resp = self._send_at(f"AT+CIPSEND={data_len}", timeout_ms=5000, expect=">")
-            if not ok:
-                self._last_error = "Send prompt not received"
-                self._send_at("AT+CIPCLOSE=0")
-                return False
+        # Enter data mode
+        if not self._request_prompt(str(len(data)).encode()):
+            self._last_error = "Send prompt not received"
+            self._close_tcp()
+            if reused:
+                # The kept-alive link died without a URC; retry once on a
+                # new connection (nothing was sent on the old one)
+                return self.send_tcp(host, port, data, timeout_ms,
+                                     keepalive, wait_ack)
+            return False
 
-        # Send actual data
-        self.uart.write(data)
-        time.sleep_ms(100)
+        if not wait_ack and keepalive:
+            # Fire and forget: the next _send_at picks up the SEND OK
+            self.uart.write(data)
+            self._pending_send_ok = True
+            self._ack_timeout_ms = timeout_ms
+            self._tcp_peer = peer
+            self._last_error = None
+            return True
 
-        # Wait for send confirmation
-        ok, resp = self._send_at("", timeout_ms=timeout_ms, expect="SEND OK")
+        # Send actual data and wait for confirmation
+        ok, resp = self._send_and_wait(data, timeout_ms=timeout_ms)
 
-        # Close connection
-        self._send_at("AT+CIPCLOSE=0", timeout_ms=5000)
+        if keepalive and ok:
+            # Leave the connection open for the next send
+            self._tcp_peer = peer
+        else:
+            # Close connection
+            self._close_tcp()
 
         if not ok:
-            self._last_error = f"Send failed: {resp}"
+            self._last_error = f"Send failed: {resp.decode('ascii', 'ignore')}"
             return False
 
         self._last_error = None
@@ -279,21 +614,24 @@ class CellularDriver(NetworkDriverBase):
             return False
 
         # Start UDP connection
-        cmd = f'AT+CIPOPEN=0,"UDP","{host}",{port}'
-        ok, resp = self._send_at(cmd, timeout_ms=10000)
+        host_b = host.encode()
+        port_b = str(port).encode()
+        if self._at_dialect == "sim800":
+            cmd = self._mkcmd(b'AT+CIPSTART="UDP","', host_b, b'","', port_b, b'"')
+            ok, resp = self._send_at(cmd, timeout_ms=10000, expect=b"CONNECT")
+        else:
+            cmd = self._mkcmd(b'AT+CIPOPEN=0,"UDP","', host_b, b'",', port_b)
+            ok, resp = self._send_at(cmd, timeout_ms=10000)
 
         if not ok:
             self._last_error = "UDP connection failed"
             return False
 
         # Send data
-        data_len = len(data)
-        ok, resp = self._send_at(f"AT+CIPSEND=0,{data_len}", timeout_ms=5000, expect=">")
+        ok = self._request_prompt(str(len(data)).encode())
 
         if ok:
-            self.uart.write(data)
-            time.sleep_ms(100)
-            ok, resp = self._send_at("", timeout_ms=5000, expect="SEND OK")
+            ok, resp = self._send_and_wait(data, timeout_ms=5000)
 
         # Close
         self._send_at("AT+CIPCLOSE=0")
@@ -304,45 +642,103 @@ class CellularDriver(NetworkDriverBase):
 
         return True
 
-    def _update_network_info(self):
-        """Update network information (RSSI, operator, cell info)."""
-        # Signal strength
-        ok, resp = self._send_at("AT+CSQ")
-        if ok and "+CSQ:" in resp:
+    def _set_creg_mode(self):
+        """Enable the extended +CREG format (LAC/Cell ID) once."""
+        ok, _ = self._send_at("AT+CREG=2")
+        if ok:
+            self._creg_mode = 2
+
+    def _parse_csq(self, resp):
+        """Parse a +CSQ response into self._rssi.
+
+        Args:
+            resp: Response bytes
+        """
+        i = resp.find(b"+CSQ:")
+        if i < 0:
+            return
+        try:
+            rssi_raw = int(resp[i + 5:resp.find(b",", i)])
+            # Convert to dBm (0-31 scale, 99=unknown)
+            if rssi_raw < 99:
+                self._rssi = -113 + (rssi_raw * 2)
+            else:
+                self._rssi = 0
+        except ValueError:
+            pass
+
+    def _parse_cops(self, resp):
+        """Parse a +COPS? response into self._operator.
+
+        Args:
+            resp: Response bytes
+        """
+        i = resp.find(b',"')
+        if i >= 0:
+            j = resp.find(b'"', i + 2)
+            if j > i:
+                self._operator = resp[i + 2:j]
+
+    def _parse_creg(self, resp):
+        """Parse a +CREG? response into self._lac and self._cell_id.
+
+        Args:
+            resp: Response bytes
+        """
+        i = resp.find(b"+CREG:")
+        if i < 0:
+            return
+        # Response: +CREG: n,stat[,"lac","ci"]
+        a = resp.find(b'"', i)
+        b = resp.find(b'"', a + 1)
+        c = resp.find(b'"', b + 1)
+        d = resp.find(b'"', c + 1)
+        if a >= 0 and b > a and c > b and d > c:
             try:
-                parts = resp.split("+CSQ:")[1].split(",")
-                rssi_raw = int(parts[0].strip())
-                # Convert to dBm (0-31 scale, 99=unknown)
-                if rssi_raw < 99:
-                    self._rssi = -113 + (rssi_raw * 2)
-                else:
-                    self._rssi = 0
-            except (IndexError, ValueError):
+                self._lac = int(resp[a + 1:b], 16)
+                self._cell_id = int(resp[c + 1:d], 16)
+            except ValueError:
                 pass
 
-        # Operator name
+    def _refresh_rssi(self):
+        """Update signal strength (AT+CSQ only)."""
+        ok, resp = self._send_at("AT+CSQ")
+        if ok:
+            self._parse_csq(resp)
+
+    def _refresh_operator(self):
+        """Update operator name (AT+COPS? only)."""
         ok, resp = self._send_at("AT+COPS?")
-        if ok and ',"' in resp:
-            try:
-                self._operator = resp.split(',"')[1].split('"')[0]
-            except IndexError:
-                pass
+        if ok:
+            self._parse_cops(resp)
 
-        # Cell info (LAC, Cell ID)
-        ok, resp = self._send_at("AT+CREG=2")
+    def _refresh_cell(self):
+        """Update LAC and Cell ID (AT+CREG? only)."""
+        if self._creg_mode != 2:
+            self._set_creg_mode()
         ok, resp = self._send_at("AT+CREG?")
-        if ok and "+CREG:" in resp:
-            try:
-                # Response: +CREG: n,stat[,lac,ci]
-                parts = resp.split(",")
-                if len(parts) >= 4:
-                    self._lac = int(parts[2].strip('" \r\n'), 16)
-                    self._cell_id = int(parts[3].strip('" \r\n'), 16)
-            except (IndexError, ValueError):
-                pass
+        if ok:
+            self._parse_creg(resp)
 
-        # Reset CREG format
-        self._send_at("AT+CREG=0")
+    def _update_network_info(self):
+        """Update network information (RSSI, operator, cell info)."""
+        if self._creg_mode != 2:
+            self._set_creg_mode()
+
+        # Responses are scanned as bytes with find() and sliced in place,
+        # rather than decoded and split() into lists
+        csq, cops, creg = self._send_batch([
+            ("AT+CSQ", 1000, b"OK"),
+            ("AT+COPS?", 1000, b"OK"),
+            ("AT+CREG?", 1000, b"OK"),
+        ])
+
+        if csq[0]:
+            self._parse_csq(csq[1])
+        if cops[0]:
+            self._parse_cops(cops[1])
+        if creg[0]:
+            self._parse_creg(creg[1])
 
     def get_rssi(self):
         """Get signal strength (RSSI).
@@ -350,7 +746,7 @@ class CellularDriver(NetworkDriverBase):
         Returns:
             int: RSSI in dBm
         """
-        self._update_network_info()
+        self._refresh_rssi()
         return self._rssi
 
     def get_ip_address(self):
@@ -360,15 +756,21 @@ class CellularDriver(NetworkDriverBase):
             str: IP address
         """
         ok, resp = self._send_at("AT+CGPADDR=1")
-        if ok and "+CGPADDR:" in resp:
-            try:
-                parts = resp.split('"')
-                if len(parts) >= 2:
-                    return parts[1]
-            except IndexError:
-                pass
+        if ok and b"+CGPADDR:" in resp:
+            i = resp.find(b'"')
+            j = resp.find(b'"', i + 1)
+            if i >= 0 and j > i:
+                return resp[i + 1:j].decode('ascii', 'replace')
         return ""
 
+    def get_operator(self):
+        """Get the operator name from the last network info refresh.
+
+        Returns:
+            str: Operator name
+        """
+        return self._operator.decode('ascii', 'replace')
+
     def get_cell_info(self):
         """Get cellular network info.
 
@@ -377,7 +779,7 @@ class CellularDriver(NetworkDriverBase):
         """
         self._update_network_info()
         return {
-            'operator': self._operator,
+            'operator': self.get_operator(),
             'lac': self._lac,
             'cell_id': self._cell_id,
             'rssi': self._rssi
@@ -394,3 +796,9 @@ class CellularDriver(NetworkDriverBase):
         self.apn = apn
         self.user = user
         self.password = password
+
+        # Encode the APN commands once rather than on every connect()
+        self._cgdcont_cmd = self._mkcmd(b'AT+CGDCONT=1,"IP","', apn.encode(), b'"')
+        self._cstt_cmd = self._mkcmd(b'AT+CSTT="', apn.encode(), b'","',
+                                     user.encode(), b'","',
+                                     password.encode(), b'"')
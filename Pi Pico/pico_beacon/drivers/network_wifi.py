@@ -3,6 +3,7 @@
 
 import time
 import socket
+import select
 
 try:
     import network
@@ -16,6 +17,12 @@ from .network_base import NetworkDriverBase
 class WiFiDriver(NetworkDriverBase):
     """WiFi network driver for Raspberry Pi Pico W."""
 
+    # How long a resolved server address is reused before a fresh DNS lookup
+    ADDR_CACHE_TTL_MS = 60000
+
+    # Interval between wlan.status() checks while associating
+    CONNECT_POLL_MS = 20
+
     def __init__(self, ssid=None, password=None):
         """Initialize WiFi driver.
 
@@ -30,10 +37,24 @@ class WiFiDriver(NetworkDriverBase):
 
         if WIFI_AVAILABLE:
             self.wlan = network.WLAN(network.STA_IF)
+
+            # wlan.status() values that mean the join attempt has failed
+            self._fail_status = tuple(
+                getattr(network, name) for name in
+                ('STAT_WRONG_PASSWORD', 'STAT_NO_AP_FOUND', 'STAT_CONNECT_FAIL')
+                if hasattr(network, name)
+            )
         else:
             self.wlan = None
             self._last_error = "WiFi not available (not Pico W?)"
 
+        # Resolved addresses: (host, port) -> (sockaddr, resolved_at_ms)
+        self._addr_cache = {}
+
+        # Persistent TCP connection (send_tcp with keepalive=True)
+        self._tcp_sock = None
+        self._tcp_peer = None
+
     def connect(self, timeout_sec=30):
         """Connect to WiFi network.
 
@@ -52,11 +73,18 @@ class WiFiDriver(NetworkDriverBase):
             return False
 
         try:
-            # Activate interface
-            self.wlan.active(True)
+            # Activate interface (skip if already up; toggling is slow on CYW43)
+            if not self.wlan.active():
+                self.wlan.active(True)
 
-            # Disconnect if already connected
             if self.wlan.isconnected():
+                # Already on the requested network: nothing to do
+                if self.wlan.config('essid') == self.ssid:
+                    self._connected = True
+                    self._last_error = None
+                    return True
+
+                # Disconnect from the other network first
                 self.wlan.disconnect()
                 time.sleep(0.5)
 
@@ -64,15 +92,27 @@ class WiFiDriver(NetworkDriverBase):
             self.wlan.connect(self.ssid, self.password)
 
             # Wait for connection
-            start = time.ticks_ms()
+            ticks_ms = time.ticks_ms
+            ticks_diff = time.ticks_diff
+            isconnected = self.wlan.isconnected
+            wlan_status = self.wlan.status
+            start = ticks_ms()
             timeout_ms = timeout_sec * 1000
 
-            while not self.wlan.isconnected():
-                if time.ticks_diff(time.ticks_ms(), start) > timeout_ms:
+            while not isconnected():
+                # Give up early on a definite failure instead of waiting
+                # out the timeout
+                status = wlan_status()
+                if status in self._fail_status:
+                    self._last_error = f"Connection failed (status {status})"
+                    self._connected = False
+                    return False
+
+                if ticks_diff(ticks_ms(), start) > timeout_ms:
                     self._last_error = "Connection timeout"
                     self._connected = False
                     return False
-                time.sleep_ms(100)
+                time.sleep_ms(self.CONNECT_POLL_MS)
 
             self._connected = True
             self._last_error = None
@@ -85,6 +125,8 @@ class WiFiDriver(NetworkDriverBase):
 
     def disconnect(self):
         """Disconnect from WiFi network."""
+        self._addr_cache.clear()
+        self._close_tcp()
         if self.wlan:
             try:
                 self.wlan.disconnect()
@@ -109,7 +151,62 @@ class WiFiDriver(NetworkDriverBase):
             self._connected = False
             return False
 
-    def send_tcp(self, host, port, data, timeout_ms=10000):
+    def _resolve(self, host, port):
+        """Resolve a server address, reusing a recent lookup if available.
+
+        Args:
+            host: Server hostname or IP address
+            port: Server port
+
+        Returns:
+            tuple: Socket address for connect()/sendto()
+        """
+        key = (host, port)
+        now = time.ticks_ms()
+        entry = self._addr_cache.get(key)
+
+        if entry is None or time.ticks_diff(now, entry[1]) > self.ADDR_CACHE_TTL_MS:
+            addr = socket.getaddrinfo(host, port)[0][-1]
+            self._addr_cache[key] = (addr, now)
+            return addr
+
+        return entry[0]
+
+    def _close_tcp(self):
+        """Close the persistent TCP connection, if any."""
+        if self._tcp_sock:
+            try:
+                self._tcp_sock.close()
+            except Exception:
+                pass
+        self._tcp_sock = None
+        self._tcp_peer = None
+
+    def _tcp_alive(self):
+        """Check that the server has not closed the persistent connection.
+
+        send() on a connection the server has closed still succeeds (the
+        data is buffered, then dropped), so a zero-timeout poll looks for
+        a hangup or a pending EOF before the socket is reused.
+
+        Returns:
+            bool: True if the socket can be reused
+        """
+        try:
+            poller = select.poll()
+            poller.register(self._tcp_sock, select.POLLIN)
+            events = poller.poll(0)
+            if not events:
+                return True
+            if events[0][1] & (select.POLLHUP | select.POLLERR):
+                return False
+            # Readable: recv() returning b"" is the server's FIN; any other
+            # bytes are unsolicited and discarded
+            return self._tcp_sock.recv(64) != b""
+        except OSError:
+            return False
+
+    def send_tcp(self, host, port, data, timeout_ms=10000, keepalive=False):
         """Send data via TCP connection.
 
         Args:
@@ -117,6 +214,8 @@ class WiFiDriver(NetworkDriverBase):
             port: Server TCP port
             data: bytes or bytearray to send
             timeout_ms: Socket timeout in milliseconds
+            keepalive: Reuse an open connection to host/port and leave it
+                open afterwards (reconnects if the server closed it)
 
         Returns:
             bool: True if sent successfully
@@ -125,6 +224,18 @@ class WiFiDriver(NetworkDriverBase):
             self._last_error = "Not connected to WiFi"
             return False
 
+        peer = (host, port)
+
+        if keepalive and self._tcp_sock:
+            if self._tcp_peer == peer and self._tcp_alive():
+                try:
+                    self._tcp_sock.send(data)
+                    self._last_error = None
+                    return True
+                except OSError:
+                    pass  # Stale connection - reconnect below
+            self._close_tcp()
+
         sock = None
         try:
             # Create socket
@@ -132,16 +243,29 @@ class WiFiDriver(NetworkDriverBase):
             sock.settimeout(timeout_ms / 1000.0)
 
             # Connect to server
-            addr = socket.getaddrinfo(host, port)[0][-1]
+            addr = self._resolve(host, port)
             sock.connect(addr)
 
+            if keepalive:
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                except (AttributeError, OSError):
+                    pass  # Not supported by every network stack
+
             # Send data
             sock.send(data)
 
+            if keepalive:
+                # Hand the socket over so the finally clause leaves it open
+                self._tcp_sock = sock
+                self._tcp_peer = peer
+                sock = None
+
             self._last_error = None
             return True
 
         except Exception as e:
+            self._addr_cache.pop((host, port), None)
             self._last_error = f"TCP send error: {e}"
             return False
 
@@ -171,13 +295,14 @@ class WiFiDriver(NetworkDriverBase):
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
-            addr = socket.getaddrinfo(host, port)[0][-1]
+            addr = self._resolve(host, port)
             sock.sendto(data, addr)
 
             self._last_error = None
             return True
 
         except Exception as e:
+            self._addr_cache.pop((host, port), None)
             self._last_error = f"UDP send error: {e}"
             return False
 
@@ -230,7 +355,8 @@ class WiFiDriver(NetworkDriverBase):
             return []
 
         try:
-            self.wlan.active(True)
+            if not self.wlan.active():
+                self.wlan.active(True)
             networks = self.wlan.scan()
             return networks
         except Exception:
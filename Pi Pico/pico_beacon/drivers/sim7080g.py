@@ -370,7 +370,7 @@ class SIM7080G:
         self._last_error = None
         return True
 
-    def send_tcp(self, host, port, data, timeout_ms=10000):
+    def send_tcp(self, host, port, data, timeout_ms=10000, keepalive=False):
         """Send data via TCP.
 
         Note: TCP does not work reliably while GNSS is active.
@@ -381,6 +381,8 @@ class SIM7080G:
             port: Server port
             data: bytes or bytearray to send
             timeout_ms: Timeout in milliseconds
+            keepalive: Accepted for NetworkBase compatibility; ignored, as
+                the connection must close so GNSS can be restarted
 
         Returns:
             bool: True if sent successfully
@@ -612,6 +614,35 @@ class SIM7080G:
                          self.hour, self.minute, self.second)
         }
 
+    def get_position_into(self, d):
+        """Fill a caller-owned dict with the data get_position() returns.
+
+        'timestamp' is kept as a 6-element list updated in place, so
+        reusing the same dict allocates no new containers.
+
+        Returns:
+            dict: d
+        """
+        d['latitude'] = self.latitude
+        d['longitude'] = self.longitude
+        d['altitude'] = self.altitude
+        d['speed'] = self.speed_kmh
+        d['heading'] = self.heading if self.heading else None
+        d['hdop'] = self.hdop
+        d['satellites'] = self.satellites
+        d['valid'] = self.gnss_valid
+
+        ts = d.get('timestamp')
+        if ts is None:
+            ts = d['timestamp'] = [0] * 6
+        ts[0] = self.year
+        ts[1] = self.month
+        ts[2] = self.day
+        ts[3] = self.hour
+        ts[4] = self.minute
+        ts[5] = self.second
+        return d
+
     # =========================================================================
     # Network Info Methods
     # =========================================================================
@@ -1,7 +1,72 @@
 # GPRS Command Handler for Pico Beacon
 # Implements RAPID 2 GPRS commands from Section 6.3 of the manual
 
+import struct
 import time
+from collections import deque
+
+from utils.logger import get_logger
+
+try:
+    import machine
+except ImportError:
+    # Host Python (unit tests): no direct reset available
+    machine = None
+
+try:
+    import micropython
+    from micropython import const
+except ImportError:
+    # Host Python: the code emitter decorators become no-ops
+    class micropython:
+        native = staticmethod(lambda f: f)
+
+    def const(x):
+        return x
+
+# Command codes (as sent by server); const() inlines them at compile time
+_CMD_RESET_TO_CONFIG = const(0x01)
+_CMD_HIBERNATE = const(0x02)
+_CMD_STANDBY = const(0x03)
+_CMD_CLEAR_STANDBY = const(0x04)
+_CMD_STATUS = const(0x05)
+_CMD_TAMPER_ON = const(0x06)
+_CMD_TAMPER_OFF = const(0x07)
+_CMD_OUTPUT_ON = const(0x08)
+_CMD_OUTPUT_OFF = const(0x09)
+_CMD_FOREVER_STANDBY = const(0x0A)
+_CMD_LOG_ERASE = const(0x0B)
+_CMD_RF_ON = const(0x0C)
+_CMD_RF_OFF = const(0x0D)
+_CMD_RF_AUTO = const(0x0E)
+_CMD_AUDIO_ON = const(0x0F)
+_CMD_AUDIO_OFF = const(0x10)
+_CMD_BUTTON_ENABLE = const(0x11)
+_CMD_BUTTON_DISABLE = const(0x12)
+_CMD_LOCATE = const(0x13)
+_CMD_SET_RATE = const(0x14)
+_CMD_UPLOAD_LOG = const(0x15)
+_CMD_REBOOT = const(0xFF)
+
+# Pending request bits
+_PENDING_STATUS = const(0x01)
+_PENDING_LOCATE = const(0x02)
+_PENDING_UPLOAD = const(0x04)
+
+# SET_RATE payload: rate type, rate value (big-endian u16)
+_RATE_FMT = ">BH"
+
+# Event codes queued on the command path and logged by drain_events()
+_EVT_UNKNOWN = const(1)
+_EVT_ERROR = const(2)
+_EVT_DROPPED = const(3)
+
+_log = get_logger("GPRS")
+
+# (ticks_ms, event code, command code, detail); oldest dropped when full.
+# detail is None or an exception class name, never the exception itself,
+# so a queued event does not keep its traceback and frames on the heap
+_events = deque((), 32)
 
 
 class GPRSCommandHandler:
@@ -22,29 +87,51 @@ class GPRSCommandHandler:
     - Button Enable/Disable: Control button functionality
     """
 
-    # Command codes (as sent by server)
-    CMD_RESET_TO_CONFIG = 0x01
-    CMD_HIBERNATE = 0x02
-    CMD_STANDBY = 0x03
-    CMD_CLEAR_STANDBY = 0x04
-    CMD_STATUS = 0x05
-    CMD_TAMPER_ON = 0x06
-    CMD_TAMPER_OFF = 0x07
-    CMD_OUTPUT_ON = 0x08
-    CMD_OUTPUT_OFF = 0x09
-    CMD_FOREVER_STANDBY = 0x0A
-    CMD_LOG_ERASE = 0x0B
-    CMD_RF_ON = 0x0C
-    CMD_RF_OFF = 0x0D
-    CMD_RF_AUTO = 0x0E
-    CMD_AUDIO_ON = 0x0F
-    CMD_AUDIO_OFF = 0x10
-    CMD_BUTTON_ENABLE = 0x11
-    CMD_BUTTON_DISABLE = 0x12
-    CMD_LOCATE = 0x13
-    CMD_SET_RATE = 0x14
-    CMD_UPLOAD_LOG = 0x15
-    CMD_REBOOT = 0xFF
+    # Command codes (public aliases of the module constants)
+    CMD_RESET_TO_CONFIG = _CMD_RESET_TO_CONFIG
+    CMD_HIBERNATE = _CMD_HIBERNATE
+    CMD_STANDBY = _CMD_STANDBY
+    CMD_CLEAR_STANDBY = _CMD_CLEAR_STANDBY
+    CMD_STATUS = _CMD_STATUS
+    CMD_TAMPER_ON = _CMD_TAMPER_ON
+    CMD_TAMPER_OFF = _CMD_TAMPER_OFF
+    CMD_OUTPUT_ON = _CMD_OUTPUT_ON
+    CMD_OUTPUT_OFF = _CMD_OUTPUT_OFF
+    CMD_FOREVER_STANDBY = _CMD_FOREVER_STANDBY
+    CMD_LOG_ERASE = _CMD_LOG_ERASE
+    CMD_RF_ON = _CMD_RF_ON
+    CMD_RF_OFF = _CMD_RF_OFF
+    CMD_RF_AUTO = _CMD_RF_AUTO
+    CMD_AUDIO_ON = _CMD_AUDIO_ON
+    CMD_AUDIO_OFF = _CMD_AUDIO_OFF
+    CMD_BUTTON_ENABLE = _CMD_BUTTON_ENABLE
+    CMD_BUTTON_DISABLE = _CMD_BUTTON_DISABLE
+    CMD_LOCATE = _CMD_LOCATE
+    CMD_SET_RATE = _CMD_SET_RATE
+    CMD_UPLOAD_LOG = _CMD_UPLOAD_LOG
+    CMD_REBOOT = _CMD_REBOOT
+
+    # Pending request bits (see consume_pending)
+    PENDING_STATUS = _PENDING_STATUS
+    PENDING_LOCATE = _PENDING_LOCATE
+    PENDING_UPLOAD = _PENDING_UPLOAD
+
+    # Max commands held back by process_command until the state allows them
+    MAX_DEFERRED = 8
+
+    # State machine methods bound in __init__
+    _SM_METHOD_NAMES = (
+        "reset_to_config", "enter_hibernate", "enter_standby", "exit_standby",
+        "enter_forever_standby", "set_rf_enabled", "set_rf_mode_auto",
+        "request_reboot", "request_log_upload",
+    )
+
+    # SET_RATE rate type -> config key
+    _RATE_KEYS = {
+        0x01: "gprs_rate_moving_sec",    # Moving
+        0x02: "gprs_rate_stopped_sec",   # Stopped
+        0x03: "gprs_rate_standby_sec",   # Standby
+    }
 
     def __init__(self, config_manager, state_machine, data_logger=None, io_controller=None):
         """Initialize GPRS command handler.
@@ -57,21 +144,32 @@ class GPRSCommandHandler:
         """
         self.config = config_manager
         self.state_machine = state_machine
+
+        # Bound config methods used by the handlers
+        self._cfg_set = config_manager.set
+        self._cfg_update = config_manager.update
+        self._cfg_save = config_manager.save
         self.logger = data_logger
         self.io = io_controller
 
+        # Bound state machine methods: name -> method (None if missing)
+        self._sm_methods = {}
+        if state_machine is not None:
+            for name in self._SM_METHOD_NAMES:
+                self._sm_methods[name] = getattr(state_machine, name, None)
+        self._sm_request_reboot = self._sm_methods.get("request_reboot")
+        self._sm_request_log_upload = self._sm_methods.get("request_log_upload")
+
         # Command queue for responses
         self._response_queue = []
 
-        # Pending status request
-        self._status_requested = False
+        # Pending status/locate/log upload requests as PENDING_* bits
+        self._pending = 0
 
-        # Pending locate request
-        self._locate_requested = False
-
-        # Pending log upload
-        self._log_upload_requested = False
+        # (cmd_code, cmd_data) held back until the state machine can run them
+        self._deferred = []
 
+    @micropython.native
     def process_command(self, cmd_code, cmd_data=None):
         """Process a GPRS command from the server.
 
@@ -82,134 +180,136 @@ class GPRSCommandHandler:
         Returns:
             bool: True if command was processed successfully
         """
-        try:
-            if cmd_code == self.CMD_RESET_TO_CONFIG:
-                return self._handle_reset_to_config()
-
-            elif cmd_code == self.CMD_HIBERNATE:
-                return self._handle_hibernate()
-
-            elif cmd_code == self.CMD_STANDBY:
-                return self._handle_standby()
+        if cmd_code not in _VALID_CODES:
+            _events.append((time.ticks_ms(), _EVT_UNKNOWN, cmd_code, None))
+            return False
 
-            elif cmd_code == self.CMD_CLEAR_STANDBY:
-                return self._handle_clear_standby()
+        if cmd_code in _DEFERRABLE and not self._can_run_now():
+            self._defer(cmd_code, cmd_data)
+            return True
 
-            elif cmd_code == self.CMD_STATUS:
-                return self._handle_status()
+        # Only the handler call itself can raise
+        try:
+            record = _CONFIG_COMMANDS.get(cmd_code)
+            if record is not None:
+                return self._apply_config_command(*record)
 
-            elif cmd_code == self.CMD_TAMPER_ON:
-                return self._handle_tamper_on()
+            handler = _DISPATCH[cmd_code]
 
-            elif cmd_code == self.CMD_TAMPER_OFF:
-                return self._handle_tamper_off()
+            # SET_RATE is the only command that carries data
+            if cmd_code == _CMD_SET_RATE:
+                return handler(self, cmd_data)
+            return handler(self)
 
-            elif cmd_code == self.CMD_OUTPUT_ON:
-                return self._handle_output_on()
+        except Exception as e:
+            _events.append((time.ticks_ms(), _EVT_ERROR, cmd_code,
+                            type(e).__name__))
+            return False
 
-            elif cmd_code == self.CMD_OUTPUT_OFF:
-                return self._handle_output_off()
+    def _can_run_now(self):
+        """Check if the state machine can take a disruptive command now."""
+        return self.state_machine is None or self.state_machine.can_handle_commands()
 
-            elif cmd_code == self.CMD_FOREVER_STANDBY:
-                return self._handle_forever_standby()
+    def _defer(self, cmd_code, cmd_data):
+        """Queue a command for pump_deferred(), dropping the oldest if full."""
+        if len(self._deferred) >= self.MAX_DEFERRED:
+            dropped = self._deferred.pop(0)
+            _events.append((time.ticks_ms(), _EVT_DROPPED, dropped[0], None))
+        self._deferred.append((cmd_code, cmd_data))
 
-            elif cmd_code == self.CMD_LOG_ERASE:
-                return self._handle_log_erase()
+    def pump_deferred(self):
+        """Run deferred commands if the state machine can now handle them.
 
-            elif cmd_code == self.CMD_RF_ON:
-                return self._handle_rf_on()
+        Called by the state machine after each state transition.
 
-            elif cmd_code == self.CMD_RF_OFF:
-                return self._handle_rf_off()
+        Returns:
+            int: Number of commands retried
+        """
+        if not self._deferred or not self._can_run_now():
+            return 0
 
-            elif cmd_code == self.CMD_RF_AUTO:
-                return self._handle_rf_auto()
+        deferred = self._deferred
+        self._deferred = []
+        for cmd_code, cmd_data in deferred:
+            # Re-queued by process_command if the state changes again
+            self.process_command(cmd_code, cmd_data)
+        return len(deferred)
 
-            elif cmd_code == self.CMD_AUDIO_ON:
-                return self._handle_audio_on()
+    def drain_events(self):
+        """Log events queued by the command path.
 
-            elif cmd_code == self.CMD_AUDIO_OFF:
-                return self._handle_audio_off()
+        Serial output can block for milliseconds, so process_command only
+        queues events; the main loop calls this when it is otherwise idle.
 
-            elif cmd_code == self.CMD_BUTTON_ENABLE:
-                return self._handle_button_enable()
+        Returns:
+            int: Number of events logged
+        """
+        count = 0
+        while _events:
+            ts, event, cmd_code, detail = _events.popleft()
+            if event == _EVT_UNKNOWN:
+                _log.warning("Unknown GPRS command: 0x%02X (t=%d)", cmd_code, ts)
+            elif event == _EVT_DROPPED:
+                _log.warning("Deferred GPRS command 0x%02X dropped (t=%d)", cmd_code, ts)
+            else:
+                _log.error("GPRS command 0x%02X error: %s (t=%d)", cmd_code, detail, ts)
+            count += 1
+        return count
 
-            elif cmd_code == self.CMD_BUTTON_DISABLE:
-                return self._handle_button_disable()
+    def process_commands(self, commands):
+        """Process several GPRS commands with a single config save.
 
-            elif cmd_code == self.CMD_LOCATE:
-                return self._handle_locate()
+        Args:
+            commands: list of (cmd_code, cmd_data) tuples
 
-            elif cmd_code == self.CMD_SET_RATE:
-                return self._handle_set_rate(cmd_data)
+        Returns:
+            list: bool result for each command
+        """
+        with self.config.transaction():
+            return [self.process_command(code, data) for code, data in commands]
 
-            elif cmd_code == self.CMD_UPLOAD_LOG:
-                return self._handle_upload_log()
+    def process_batch(self, commands):
+        """Process the commands delivered by one transport poll.
 
-            elif cmd_code == self.CMD_REBOOT:
-                return self._handle_reboot()
+        Every command is run even if an earlier one fails, and config is
+        written to flash at most once, only if a command changed it.
 
-            else:
-                print(f"Unknown GPRS command: 0x{cmd_code:02X}")
-                return False
+        Args:
+            commands: iterable of (cmd_code, cmd_data) tuples
 
-        except Exception as e:
-            print(f"GPRS command error: {e}")
-            return False
+        Returns:
+            bool: True if all commands were processed successfully
+        """
+        ok = True
+        for result in self.process_commands(commands):
+            if not result:
+                ok = False
+        return ok
 
     # ==========================================================================
-    # MODE COMMANDS
+    # TABLE-DRIVEN COMMANDS
     # ==========================================================================
 
-    def _handle_reset_to_config(self):
-        """Reset to Config - Reset device to stored configuration."""
-        self.config.set("operating_mode", "active")
-        self.config.set("rf_mode", "auto")
-        self.config.set("rf_enabled", True)
-        self.config.save()
-
-        if self.state_machine:
-            self.state_machine.reset_to_config()
+    def _apply_config_command(self, updates, save, method, args):
+        """Apply a _CONFIG_COMMANDS record.
 
-        return True
-
-    def _handle_hibernate(self):
-        """Hibernate - Enter low power hibernate mode."""
-        self.config.set("operating_mode", "hibernate")
-        self.config.save()
-
-        if self.state_machine:
-            self.state_machine.enter_hibernate()
-
-        return True
-
-    def _handle_standby(self):
-        """Standby - Enter standby mode with periodic wake."""
-        self.config.set("operating_mode", "standby")
-        self.config.save()
-
-        if self.state_machine:
-            self.state_machine.enter_standby()
-
-        return True
-
-    def _handle_clear_standby(self):
-        """Clear Standby - Exit standby and return to active mode."""
-        self.config.set("operating_mode", "active")
-        self.config.save()
-
-        if self.state_machine:
-            self.state_machine.exit_standby()
-
-        return True
+        Args:
+            updates: dict of config keys to set
+            save: Save config to flash afterwards
+            method: State machine method to call (or None)
+            args: Arguments for the state machine method
 
-    def _handle_forever_standby(self):
-        """Forever Standby - Enter indefinite standby mode."""
-        self.config.set("operating_mode", "forever_standby")
-        self.config.save()
+        Returns:
+            bool: True
+        """
+        # Skip the flash write when the config already holds these values
+        if self._cfg_update(updates) and save:
+            self._cfg_save()
 
-        if self.state_machine:
-            self.state_machine.enter_forever_standby()
+        if method:
+            sm_method = self._sm_methods.get(method)
+            if sm_method:
+                sm_method(*args)
 
         return True
 
@@ -219,29 +319,12 @@ class GPRSCommandHandler:
 
     def _handle_status(self):
         """Status - Request a status report."""
-        self._status_requested = True
+        self._pending |= _PENDING_STATUS
         return True
 
     def _handle_locate(self):
         """Locate - Request immediate position report."""
-        self._locate_requested = True
-        return True
-
-    # ==========================================================================
-    # TAMPER COMMANDS
-    # ==========================================================================
-
-    def _handle_tamper_on(self):
-        """Tamper On - Enable tamper detection alerts."""
-        self.config.set("tamper_enabled", True)
-        self.config.set("tamper_alert_enabled", True)
-        self.config.save()
-        return True
-
-    def _handle_tamper_off(self):
-        """Tamper Off - Disable tamper detection alerts."""
-        self.config.set("tamper_alert_enabled", False)
-        self.config.save()
+        self._pending |= _PENDING_LOCATE
         return True
 
     # ==========================================================================
@@ -253,7 +336,7 @@ class GPRSCommandHandler:
         if self.io:
             self.io.set_output(True)
         else:
-            self.config.set("output_state", True)
+            self._cfg_set("output_state", True)
         return True
 
     def _handle_output_off(self):
@@ -261,7 +344,7 @@ class GPRSCommandHandler:
         if self.io:
             self.io.set_output(False)
         else:
-            self.config.set("output_state", False)
+            self._cfg_set("output_state", False)
         return True
 
     # ==========================================================================
@@ -271,91 +354,14 @@ class GPRSCommandHandler:
     def _handle_log_erase(self):
         """Log Erase - Erase stored position logs."""
         if self.logger:
-            # Close current logs
-            self.logger.close()
-            # Delete log files
-            for filepath in self.logger.get_log_files():
-                try:
-                    import os
-                    os.remove(filepath)
-                except OSError:
-                    pass
-            # Reopen fresh logs
-            self.logger._open_logs()
+            self.logger.erase_all()
         return True
 
     def _handle_upload_log(self):
         """Upload Log - Request log upload to server."""
-        self._log_upload_requested = True
-        if self.state_machine:
-            self.state_machine.request_log_upload()
-        return True
-
-    # ==========================================================================
-    # RF COMMANDS
-    # ==========================================================================
-
-    def _handle_rf_on(self):
-        """RF On - Enable RF transmission."""
-        self.config.set("rf_enabled", True)
-        self.config.set("rf_mode", "on")
-        self.config.save()
-
-        if self.state_machine:
-            self.state_machine.set_rf_enabled(True)
-
-        return True
-
-    def _handle_rf_off(self):
-        """RF Off - Disable RF transmission (logging only)."""
-        self.config.set("rf_enabled", False)
-        self.config.set("rf_mode", "off")
-        self.config.save()
-
-        if self.state_machine:
-            self.state_machine.set_rf_enabled(False)
-
-        return True
-
-    def _handle_rf_auto(self):
-        """RF Auto - Automatic RF control."""
-        self.config.set("rf_mode", "auto")
-        self.config.set("rf_enabled", True)
-        self.config.save()
-
-        if self.state_machine:
-            self.state_machine.set_rf_mode_auto()
-
-        return True
-
-    # ==========================================================================
-    # AUDIO COMMANDS (STUB - No audio on Pico)
-    # ==========================================================================
-
-    def _handle_audio_on(self):
-        """Audio On - Enable audio alerts (not implemented)."""
-        self.config.set("audio_enabled", True)
-        return True
-
-    def _handle_audio_off(self):
-        """Audio Off - Disable audio alerts (not implemented)."""
-        self.config.set("audio_enabled", False)
-        return True
-
-    # ==========================================================================
-    # BUTTON COMMANDS
-    # ==========================================================================
-
-    def _handle_button_enable(self):
-        """Button Enable - Enable physical button."""
-        self.config.set("button_enabled", True)
-        self.config.save()
-        return True
-
-    def _handle_button_disable(self):
-        """Button Disable - Disable physical button."""
-        self.config.set("button_enabled", False)
-        self.config.save()
+        self._pending |= _PENDING_UPLOAD
+        if self._sm_request_log_upload:
+            self._sm_request_log_upload()
         return True
 
     # ==========================================================================
@@ -372,24 +378,22 @@ class GPRSCommandHandler:
         if not cmd_data or len(cmd_data) < 3:
             return False
 
-        rate_type = cmd_data[0]
-        rate_value = (cmd_data[1] << 8) | cmd_data[2]
-
-        # Rate types
-        RATE_MOVING = 0x01
-        RATE_STOPPED = 0x02
-        RATE_STANDBY = 0x03
+        rate_type, rate_value = struct.unpack_from(_RATE_FMT, cmd_data)
 
-        if rate_type == RATE_MOVING:
-            self.config.set("gprs_rate_moving_sec", rate_value)
-        elif rate_type == RATE_STOPPED:
-            self.config.set("gprs_rate_stopped_sec", rate_value)
-        elif rate_type == RATE_STANDBY:
-            self.config.set("gprs_rate_standby_sec", rate_value)
-        else:
+        key = self._RATE_KEYS.get(rate_type)
+        if key is None:
             return False
 
-        self.config.save()
+        if self._cfg_set(key, rate_value):
+            self._cfg_save()
+        return True
+
+    # ==========================================================================
+    # AUDIO COMMANDS (STUB - No audio on Pico)
+    # ==========================================================================
+
+    def _handle_audio(self):
+        """Audio On/Off - Accepted and ignored (no audio on Pico)."""
         return True
 
     # ==========================================================================
@@ -398,11 +402,10 @@ class GPRSCommandHandler:
 
     def _handle_reboot(self):
         """Reboot - Restart the device."""
-        if self.state_machine:
-            self.state_machine.request_reboot()
-        else:
+        if self._sm_request_reboot:
+            self._sm_request_reboot()
+        elif machine is not None:
             # Direct reboot
-            import machine
             machine.reset()
         return True
 
@@ -410,20 +413,85 @@ class GPRSCommandHandler:
     # STATUS CHECKING
     # ==========================================================================
 
-    def is_status_requested(self):
-        """Check if status report was requested."""
-        result = self._status_requested
-        self._status_requested = False
-        return result
-
-    def is_locate_requested(self):
-        """Check if locate (immediate position) was requested."""
-        result = self._locate_requested
-        self._locate_requested = False
-        return result
-
-    def is_log_upload_requested(self):
-        """Check if log upload was requested."""
-        result = self._log_upload_requested
-        self._log_upload_requested = False
-        return result
+    def is_any_pending(self):
+        """Check if any status, locate or log upload request is pending."""
+        return bool(self._pending)
+
+    def consume_pending(self, mask):
+        """Check and clear pending requests.
+
+        Args:
+            mask: PENDING_* bit(s) to consume
+
+        Returns:
+            bool: True if any of the requested bits was pending
+        """
+        result = self._pending & mask
+        self._pending &= ~mask
+        return bool(result)
+
+    # ==========================================================================
+    # DISPATCH TABLE
+    # ==========================================================================
+
+    # Commands that only change config and notify the state machine:
+    # code -> (config updates, save to flash, state machine method, args)
+    _CONFIG_COMMANDS = {
+        # Mode commands
+        _CMD_RESET_TO_CONFIG: ({"operating_mode": "active", "rf_mode": "auto",
+                               "rf_enabled": True}, True, "reset_to_config", ()),
+        _CMD_HIBERNATE: ({"operating_mode": "hibernate"}, True, "enter_hibernate", ()),
+        _CMD_STANDBY: ({"operating_mode": "standby"}, True, "enter_standby", ()),
+        _CMD_CLEAR_STANDBY: ({"operating_mode": "active"}, True, "exit_standby", ()),
+        _CMD_FOREVER_STANDBY: ({"operating_mode": "forever_standby"}, True,
+                              "enter_forever_standby", ()),
+
+        # Tamper commands
+        _CMD_TAMPER_ON: ({"tamper_enabled": True, "tamper_alert_enabled": True},
+                        True, None, ()),
+        _CMD_TAMPER_OFF: ({"tamper_alert_enabled": False}, True, None, ()),
+
+        # RF commands
+        _CMD_RF_ON: ({"rf_enabled": True, "rf_mode": "on"}, True,
+                    "set_rf_enabled", (True,)),
+        _CMD_RF_OFF: ({"rf_enabled": False, "rf_mode": "off"}, True,
+                     "set_rf_enabled", (False,)),
+        _CMD_RF_AUTO: ({"rf_mode": "auto", "rf_enabled": True}, True,
+                      "set_rf_mode_auto", ()),
+
+        # Button commands
+        _CMD_BUTTON_ENABLE: ({"button_enabled": True}, True, None, ()),
+        _CMD_BUTTON_DISABLE: ({"button_enabled": False}, True, None, ()),
+    }
+
+    # Commands with their own handler: code -> handler function
+    _DISPATCH = {
+        _CMD_STATUS: _handle_status,
+        _CMD_OUTPUT_ON: _handle_output_on,
+        _CMD_OUTPUT_OFF: _handle_output_off,
+        _CMD_LOG_ERASE: _handle_log_erase,
+        _CMD_LOCATE: _handle_locate,
+        _CMD_SET_RATE: _handle_set_rate,
+        _CMD_UPLOAD_LOG: _handle_upload_log,
+        _CMD_REBOOT: _handle_reboot,
+        _CMD_AUDIO_ON: _handle_audio,
+        _CMD_AUDIO_OFF: _handle_audio,
+    }
+
+    # Commands that would disrupt a transmit or log upload in progress;
+    # process_command defers these until can_handle_commands() allows
+    _DEFERRABLE = frozenset((
+        _CMD_RESET_TO_CONFIG, _CMD_HIBERNATE, _CMD_STANDBY, _CMD_CLEAR_STANDBY,
+        _CMD_FOREVER_STANDBY, _CMD_LOG_ERASE, _CMD_UPLOAD_LOG, _CMD_REBOOT,
+    ))
+
+    # Codes accepted by process_command
+    _VALID_CODES = frozenset(_CONFIG_COMMANDS) | frozenset(_DISPATCH)
+
+
+# Module-level aliases so process_command does global rather than
+# attribute lookups
+_CONFIG_COMMANDS = GPRSCommandHandler._CONFIG_COMMANDS
+_DISPATCH = GPRSCommandHandler._DISPATCH
+_DEFERRABLE = GPRSCommandHandler._DEFERRABLE
+_VALID_CODES = GPRSCommandHandler._VALID_CODES
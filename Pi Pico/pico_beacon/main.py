@@ -11,11 +11,57 @@
 #   - "continuous": Continuous reporting at moving rate
 #   - "logging": Local logging only (no network)
 
+import gc
 import time
+from time import ticks_ms, ticks_diff, ticks_add, sleep_ms
 import machine
 
+try:
+    import random
+except ImportError:
+    import urandom as random
+
+try:
+    import select
+except ImportError:
+    import uselect as select
+
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+
 from config import ConfigManager, Pins, State, Timing, OperatingMode, AlertType
 
+# Timing constants; const() inlines them at compile time
+
+# Deployment mode duration (20 minutes in ms)
+_DEPLOYMENT_DURATION_MS = const(20 * 60 * 1000)
+
+# Main loop period
+_LOOP_IDLE_MS = const(100)
+
+# Main loop period while stopped in READY, where nothing is due for seconds
+_LOOP_IDLE_STOPPED_MS = const(500)
+
+# The idle wait ends early only once this many GPS bytes are buffered
+# (about one NMEA sentence); smaller arrivals are rechecked each slice
+_IDLE_WAKE_BYTES = const(64)
+_IDLE_WAKE_SLICE_MS = const(20)
+
+# Retry backoff cap, kept well below the 30 s watchdog timeout
+_RETRY_MAX_MS = const(20000)
+
+# Minimum interval between network link probes in READY
+_NET_CHECK_MS = const(1000)
+
+# Unsent reports kept for resending; 8 x 149 bytes fits one TCP segment
+_TX_BACKLOG_MAX = const(8)
+
+# How long RSSI and cell info from the modem are reused before re-querying
+_CELL_INFO_TTL_MS = const(60000)
+
 
 class SIM7080GGPSWrapper:
     """Wrapper to provide GPS-compatible interface for SIM7080G integrated GNSS."""
@@ -88,6 +134,10 @@ class SIM7080GGPSWrapper:
         """Get current position data."""
         return self._modem.get_position()
 
+    def get_position_into(self, d):
+        """Fill a caller-owned dict with current position data."""
+        return self._modem.get_position_into(d)
+
     def wait_for_fix(self, timeout_sec=120, callback=None):
         """Wait for GPS fix."""
         return self._modem.gnss_wait_for_fix(timeout_sec, callback)
@@ -96,13 +146,10 @@ class SIM7080GGPSWrapper:
 class PicoBeacon:
     """Main beacon application with RAPID 2 state machine."""
 
-    # Deployment mode duration (20 minutes in ms)
-    DEPLOYMENT_DURATION_MS = 20 * 60 * 1000
-
     def __init__(self):
         """Initialize the beacon."""
-        # Startup time for deployment mode
-        self._startup_time = time.ticks_ms()
+        # Deployment mode ends _DEPLOYMENT_DURATION_MS after startup
+        self._deployment_expiry = ticks_add(ticks_ms(), _DEPLOYMENT_DURATION_MS)
 
         # Late imports to reduce memory on startup
         from utils.logger import Logger, LogLevel
@@ -111,6 +158,7 @@ class PicoBeacon:
 
         # Configuration
         self.config = ConfigManager()
+        self._cache_config()
         self._rf_enabled = self.config.get("rf_enabled", True)
         self._rf_mode = self.config.get("rf_mode", "auto")
 
@@ -124,24 +172,49 @@ class PicoBeacon:
             self.log.info("  - Deployment mode: DISABLED")
             self.log.info("  - Watchdog: DISABLED")
 
-        self.log.info(f"Serial: {self.config.get('serial_number')}")
-        self.log.info(f"Server: {self.config.get('server_host')}:{self.config.get('server_port')}")
+        self.log.info("Serial: %s", self.config.get('serial_number'))
+        self.log.info("Server: %s:%s", self.config.get('server_host'), self.config.get('server_port'))
 
-        # Initialize components
+        # Initialize components needed before the first GPS fix; the
+        # rest are set up by _init_deferred() on first entry to READY
         self._init_leds()
         self._init_power()
         self._init_gps()
         self._init_network()
-        self._init_protocol()
-        self._init_data_logger()
         self._init_motion_sensor()
-        self._init_io_controller()
-        self._init_command_handlers()
+        self.data_logger = None
+        self.io_controller = None
+        self.tamper_detector = None
+        self.sms_handler = None
+        self.gprs_handler = None
+
+        # Optional driver methods, looked up once rather than per loop pass
+        self._motion_is_moving = getattr(self.motion_sensor, 'is_moving', None)
+        self._net_get_cell_info = getattr(self.network, 'get_cell_info', None)
+        self._net_get_rssi = getattr(self.network, 'get_rssi', None)
+        self._net_send_sms = getattr(self.network, 'send_sms', None)
+        self._use_udp = self._use_udp and hasattr(self.network, 'send_udp')
 
         # State machine
         self.state = State.STARTUP
+        self._state_dispatch = {
+            State.STARTUP: self._state_startup,
+            State.INIT: self._state_init,
+            State.GPS_ACQUIRE: self._state_gps_acquire,
+            State.NETWORK_CONNECT: self._state_network_connect,
+            State.READY: self._state_ready_first,
+            State.TRANSMIT: self._state_transmit,
+            State.SLEEP: self._state_sleep,
+            State.STANDBY: self._state_standby,
+            State.HIBERNATE: self._state_hibernate,
+            State.LOG_UPLOAD: self._state_log_upload,
+            State.ERROR: self._state_error,
+        }
         self.last_transmit_time = 0
         self.last_log_time = 0
+        self._last_net_check_ms = 0
+        self._cell_info_ms = None
+        self._snapshot_ms = None
         self.retry_count = 0
         self.error_message = None
 
@@ -156,8 +229,15 @@ class PicoBeacon:
         self._reboot_requested = False
         self._log_upload_requested = False
 
-        # Alerts pending
-        self._pending_alerts = []
+        # Alerts pending, as an AlertType bitmask
+        self._pending_alerts = 0
+
+        # Reports that failed every retry, oldest first
+        self._tx_backlog = []
+
+        # Wake the idle wait early when a GPS sentence arrives
+        self._idle_uart = getattr(self.gps, 'uart', None)
+        self._idle_poll = self._init_idle_poll()
 
         # Watchdog timer - disabled in test mode
         if self._test_mode:
@@ -171,6 +251,26 @@ class PicoBeacon:
 
         self.log.info("Initialization complete")
 
+    def _cache_config(self):
+        """Cache config values read on every main loop iteration.
+
+        run() calls this again whenever config.version changes.
+        """
+        get = self.config.get
+        self._config_version = self.config.version
+        self._motion_timeout_ms = get("motion_timeout_sec", 120) * 1000
+        self._log_interval_ms = get("logging_rate_sec", 10) * 1000
+        self._rate_moving_ms = get("gprs_rate_moving_sec", 10) * 1000
+        self._rate_stopped_ms = get("gprs_rate_stopped_sec", 60) * 1000
+        self._rate_standby_ms = get("gprs_rate_standby_sec", 3600) * 1000
+        self._server_host = get("server_host")
+        self._server_port = get("server_port")
+        self._connect_timeout_sec = get("connection_timeout_sec", 120)
+        self._deep_sleep_enabled = get("deep_sleep_enabled", False)
+        mode = get("operating_mode", OperatingMode.ACTIVE)
+        self._mode_standby = mode == OperatingMode.STANDBY or mode == "forever_standby"
+        self._mode_logging_only = mode == OperatingMode.LOGGING
+
     def _init_leds(self):
         """Initialize status LEDs."""
         from utils.led_status import StatusLED
@@ -188,8 +288,8 @@ class PicoBeacon:
         from utils.power_manager import PowerManager
         self.power = PowerManager(
             battery_adc_pin=Pins.BATTERY_ADC,
-            gps_enable_pin=getattr(Pins, 'GPS_ENABLE', None),
-            cell_enable_pin=getattr(Pins, 'CELL_ENABLE', None)
+            gps_enable_pin=Pins.GPS_ENABLE,
+            cell_enable_pin=Pins.CELL_ENABLE
         )
 
     def _init_gps(self):
@@ -213,7 +313,7 @@ class PicoBeacon:
             tx_pin = self.config.get("external_gps_tx_pin", 4)
             rx_pin = self.config.get("external_gps_rx_pin", 5)
             baudrate = self.config.get("external_gps_baudrate", 9600)
-            self.log.info(f"Using external GPS on UART{uart_id} (TX={tx_pin}, RX={rx_pin})")
+            self.log.info("Using external GPS on UART%d (TX=%d, RX=%d)", uart_id, tx_pin, rx_pin)
         else:
             # Default GPS pins (when not using SIM7080G)
             uart_id = 0
@@ -272,12 +372,38 @@ class PicoBeacon:
             )
             self._use_udp = False
 
+    def _init_deferred(self):
+        """Initialize the components first needed in READY.
+
+        Deferring these imports keeps them out of the heap while the
+        drivers start up and the GPS acquires its first fix.
+        """
+        gc.collect()
+        self._init_protocol()
+        self._init_data_logger()
+        self._init_io_controller()
+        self._init_command_handlers()
+        gc.collect()
+
+        # Collect automatically once a quarter of the remaining free heap
+        # has been allocated, before fragmentation makes allocations fail
+        try:
+            gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+        except AttributeError:
+            pass  # Host Python has no gc.threshold()
+
     def _init_protocol(self):
         """Initialize ciNet protocol handler."""
         from protocol.cinet_message import CiNetMessage, DeviceStatus
         self.protocol = CiNetMessage(self.config)
         self.device_status = DeviceStatus()
 
+        # Transmit buffer filled in place by protocol.build_into()
+        self._msg_buf = bytearray(CiNetMessage.MSG_LENGTH)
+
+        # Position dict refilled by gps.get_position_into() for each report
+        self._gps_data = {}
+
     def _init_data_logger(self):
         """Initialize data logger."""
         if not self.config.get("logging_enabled", True):
@@ -289,15 +415,19 @@ class PicoBeacon:
             use_sd = self.config.get("log_to_sd_card", False)
             csv_enabled = self.config.get("log_format_csv", True)
             json_enabled = self.config.get("log_format_json", False)
+            bin_enabled = self.config.get("log_format_bin", False)
+            compress = self.config.get("log_compress", False)
 
             if use_sd:
-                self.data_logger = SDCardLogger(enable_csv=csv_enabled, enable_json=json_enabled)
+                self.data_logger = SDCardLogger(enable_csv=csv_enabled, enable_json=json_enabled,
+                                                enable_bin=bin_enabled, enable_compress=compress)
             else:
-                self.data_logger = DataLogger(enable_csv=csv_enabled, enable_json=json_enabled)
+                self.data_logger = DataLogger(enable_csv=csv_enabled, enable_json=json_enabled,
+                                              enable_bin=bin_enabled, enable_compress=compress)
 
             self.log.info("Data logging enabled")
         except Exception as e:
-            self.log.error(f"Logger init failed: {e}")
+            self.log.error("Logger init failed: %s", e)
             self.data_logger = None
 
     def _init_motion_sensor(self):
@@ -324,9 +454,9 @@ class PicoBeacon:
                 threshold = self.config.get("motion_threshold_g", 0.15)
                 self.motion_sensor.configure_threshold(threshold)
                 self.motion_sensor.set_callback(self._motion_callback)
-                self.log.info(f"Motion sensor: {sensor_type}")
+                self.log.info("Motion sensor: %s", sensor_type)
         except Exception as e:
-            self.log.error(f"Motion sensor init failed: {e}")
+            self.log.error("Motion sensor init failed: %s", e)
             self.motion_sensor = None
 
     def _init_io_controller(self):
@@ -358,7 +488,7 @@ class PicoBeacon:
 
             self.log.info("I/O controller initialized")
         except Exception as e:
-            self.log.error(f"I/O init failed: {e}")
+            self.log.error("I/O init failed: %s", e)
             self.io_controller = None
             self.tamper_detector = None
 
@@ -378,22 +508,74 @@ class PicoBeacon:
 
             self.log.info("Command handlers initialized")
         except Exception as e:
-            self.log.error(f"Command handler init failed: {e}")
+            self.log.error("Command handler init failed: %s", e)
             self.sms_handler = None
             self.gprs_handler = None
 
+    def _init_idle_poll(self):
+        """Create a poller on the external GPS UART for the idle wait.
+
+        Returns:
+            poll object, or None if there is no UART to wait on
+        """
+        uart = self._idle_uart
+        if uart is None:
+            return None
+        try:
+            poller = select.poll()
+            poller.register(uart, select.POLLIN)
+            return poller
+        except (AttributeError, OSError, TypeError):
+            return None
+
+    def _idle_wait(self, start):
+        """Wait for the next loop iteration, returning early on GPS data.
+
+        The loop period is _LOOP_IDLE_STOPPED_MS when stopped in READY,
+        otherwise _LOOP_IDLE_MS, measured from the start of the iteration
+        so time spent working is not added on top of the wait.
+
+        POLLIN fires on the first received byte, so a wake only ends the
+        wait once _IDLE_WAKE_BYTES are buffered; otherwise it sleeps
+        _IDLE_WAKE_SLICE_MS and checks again, keeping the loop paced while
+        a sentence is still arriving.
+
+        Args:
+            start: ticks_ms() taken at the top of this iteration
+        """
+        if self._is_moving or self.state != State.READY:
+            period_ms = _LOOP_IDLE_MS
+        else:
+            period_ms = _LOOP_IDLE_STOPPED_MS
+        deadline = ticks_add(start, period_ms)
+        idle_ms = ticks_diff(deadline, ticks_ms())
+        if not self._idle_poll:
+            if idle_ms > 0:
+                sleep_ms(idle_ms)
+            return
+        while idle_ms > 0:
+            if not self._idle_poll.poll(idle_ms):
+                return
+            if self._idle_uart.any() >= _IDLE_WAKE_BYTES:
+                return
+            sleep_ms(min(_IDLE_WAKE_SLICE_MS, idle_ms))
+            idle_ms = ticks_diff(deadline, ticks_ms())
+
     def _motion_callback(self):
-        """Callback when motion is detected."""
+        """Callback when motion is detected.
+
+        Runs from the sensor's pin IRQ, so it only sets a flag. The
+        driver's motion flag is picked up by _update_motion_state() on
+        the next loop pass, which marks the beacon moving.
+        """
         self._motion_woke_us = True
-        self._is_moving = True
-        self._motion_timeout_start = time.ticks_ms()
 
     def _handle_io_alert(self, alert_type, value):
         """Handle I/O or tamper alerts."""
         if alert_type == "input_change" and self.config.get("alert_input_change", True):
-            self._pending_alerts.append((AlertType.INPUT_CHANGE, value))
+            self._pending_alerts |= AlertType.INPUT_CHANGE
         elif alert_type == "tamper" and self.config.get("alert_tamper", True):
-            self._pending_alerts.append((AlertType.TAMPER, value))
+            self._pending_alerts |= AlertType.TAMPER
 
     # ==========================================================================
     # STATE MACHINE METHODS (called by command handlers)
@@ -402,7 +584,7 @@ class PicoBeacon:
     def set_rf_enabled(self, enabled):
         """Enable/disable RF transmission."""
         self._rf_enabled = enabled
-        self.log.info(f"RF {'enabled' if enabled else 'disabled'}")
+        self.log.info("RF %s", "enabled" if enabled else "disabled")
 
     def set_rf_mode_auto(self):
         """Set RF to automatic mode."""
@@ -456,6 +638,13 @@ class PicoBeacon:
         """Request log upload."""
         self._log_upload_requested = True
 
+    def can_handle_commands(self):
+        """Check if mode, erase and reboot commands can run now.
+
+        They are deferred while a transmit or log upload is in progress.
+        """
+        return self.state not in (State.TRANSMIT, State.LOG_UPLOAD)
+
     def get_battery_percent(self):
         """Get battery percentage."""
         return self.power.get_battery_percentage()
@@ -478,31 +667,41 @@ class PicoBeacon:
                 if self.watchdog:
                     self.watchdog.feed()
 
+                # Refresh cached config after commands changed it
+                if self.config.version != self._config_version:
+                    self._cache_config()
+
+                # One timestamp for every interval check this iteration
+                now = ticks_ms()
+
                 # Check for reboot request
                 if self._reboot_requested:
                     self.log.info("Rebooting...")
-                    time.sleep_ms(500)
+                    self._close_logs()
+                    sleep_ms(500)
                     machine.reset()
 
                 # Update GPS
                 self.gps.update()
 
                 # Update motion state
-                self._update_motion_state()
+                self._update_motion_state(now)
 
                 # Update I/O controller
                 if self.io_controller:
                     self.io_controller.update()
                     self.io_controller.update_motion_state(self._is_moving)
 
-                # Check deployment mode expiry
-                self._check_deployment_mode()
-
                 # Run state machine
-                self._run_state_machine()
+                prev_state = self.state
+                self._run_state_machine(now)
+
+                # Retry GPRS commands deferred in the previous state
+                if self.state != prev_state and self.gprs_handler:
+                    self.gprs_handler.pump_deferred()
 
                 # Handle data logging
-                self._handle_data_logging()
+                self._handle_data_logging(now)
 
                 # Handle SMS tracking updates
                 if self.sms_handler and self.sms_handler.is_tracking:
@@ -510,51 +709,57 @@ class PicoBeacon:
                     if msg:
                         self._send_sms_response(msg)
 
-                # Small delay
-                time.sleep_ms(100)
+                # Write queued log records and GPRS command events while
+                # the loop is idle
+                if self.data_logger:
+                    self.data_logger.flush_pending(Timing.LOG_FLUSH_INTERVAL_MS)
+                if self.gprs_handler:
+                    self.gprs_handler.drain_events()
+
+                # Idle until GPS data arrives or the loop period is up
+                self._idle_wait(now)
+
+            except MemoryError:
+                # Free the heap before anything else tries to allocate,
+                # and don't format the exception
+                gc.collect()
+                self.log.error("Main loop out of memory")
+                self.leds.indicate_error()
+                self.state = State.ERROR
+                self.error_message = "Out of memory"
+                time.sleep(1)
 
             except Exception as e:
-                self.log.error(f"Main loop error: {e}")
+                self.log.error("Main loop error: %s", e)
                 self.leds.indicate_error()
                 self.state = State.ERROR
                 self.error_message = str(e)
                 time.sleep(1)
 
-    def _update_motion_state(self):
+    def _update_motion_state(self, now):
         """Update motion state with timeout."""
         # Check motion sensor
         if self.motion_sensor:
             if self.motion_sensor.is_motion_detected():
                 self._is_moving = True
-                self._motion_timeout_start = time.ticks_ms()
-            elif hasattr(self.motion_sensor, 'is_moving'):
-                if self.motion_sensor.is_moving():
+                self._motion_timeout_start = now
+            elif self._motion_is_moving:
+                if self._motion_is_moving():
                     self._is_moving = True
-                    self._motion_timeout_start = time.ticks_ms()
+                    self._motion_timeout_start = now
         else:
             # Use GPS speed
             if self.gps.speed_kmh > 2.0:
                 self._is_moving = True
-                self._motion_timeout_start = time.ticks_ms()
+                self._motion_timeout_start = now
 
         # Check motion timeout
         if self._is_moving:
-            timeout_sec = self.config.get("motion_timeout_sec", 120)
-            elapsed = time.ticks_diff(time.ticks_ms(), self._motion_timeout_start)
-            if elapsed > timeout_sec * 1000:
+            elapsed = ticks_diff(now, self._motion_timeout_start)
+            if elapsed > self._motion_timeout_ms:
                 self._is_moving = False
                 self.log.info("Motion timeout - now stopped")
 
-    def _check_deployment_mode(self):
-        """Check if deployment mode should end (after 20 minutes)."""
-        if not self._deployment_mode:
-            return
-
-        elapsed = time.ticks_diff(time.ticks_ms(), self._startup_time)
-        if elapsed > self.DEPLOYMENT_DURATION_MS:
-            self._deployment_mode = False
-            self.log.info("Deployment mode ended - switching to normal operation")
-
     def _get_report_interval_ms(self):
         """Get current report interval based on mode and motion.
 
@@ -565,72 +770,68 @@ class PicoBeacon:
         - Stopped: Stopped rate (5-86400 sec)
         - Standby: Standby rate (hourly check-in)
         """
-        mode = self.config.get("operating_mode", OperatingMode.ACTIVE)
-
-        # Deployment mode: use moving rate
+        # Deployment mode: use moving rate until it expires
         if self._deployment_mode:
-            return self.config.get("gprs_rate_moving_sec", 10) * 1000
+            if ticks_diff(ticks_ms(), self._deployment_expiry) < 0:
+                return self._rate_moving_ms
+            self._deployment_mode = False
+            self.log.info("Deployment mode ended - switching to normal operation")
 
         # Continuous mode: use moving rate
         if self._continuous_mode:
-            return self.config.get("gprs_rate_moving_sec", 10) * 1000
+            return self._rate_moving_ms
 
         # Standby mode: use standby rate
-        if mode == OperatingMode.STANDBY or mode == "forever_standby":
-            return self.config.get("gprs_rate_standby_sec", 3600) * 1000
+        if self._mode_standby:
+            return self._rate_standby_ms
 
         # Active mode: adaptive based on motion
         if self._is_moving:
-            return self.config.get("gprs_rate_moving_sec", 10) * 1000
+            return self._rate_moving_ms
         else:
-            return self.config.get("gprs_rate_stopped_sec", 60) * 1000
+            return self._rate_stopped_ms
 
-    def _handle_data_logging(self):
+    def _handle_data_logging(self, now):
         """Handle local data logging."""
         if not self.data_logger:
             return
 
-        log_interval = self.config.get("logging_rate_sec", 10) * 1000
-        elapsed = time.ticks_diff(time.ticks_ms(), self.last_log_time)
+        elapsed = ticks_diff(now, self.last_log_time)
 
-        if elapsed >= log_interval or self.last_log_time == 0:
-            gps_data = self.gps.get_position()
-            self._update_device_status()
+        if elapsed >= self._log_interval_ms or self.last_log_time == 0:
+            gps_data = self._snapshot(now)
 
             if self.data_logger.log(gps_data, self.device_status.to_dict()):
-                self.last_log_time = time.ticks_ms()
-
-    def _run_state_machine(self):
-        """Execute current state."""
-        if self.state == State.STARTUP:
-            self._state_startup()
-        elif self.state == State.INIT:
-            self._state_init()
-        elif self.state == State.GPS_ACQUIRE:
-            self._state_gps_acquire()
-        elif self.state == State.NETWORK_CONNECT:
-            self._state_network_connect()
-        elif self.state == State.READY:
-            self._state_ready()
-        elif self.state == State.TRANSMIT:
-            self._state_transmit()
-        elif self.state == State.SLEEP:
-            self._state_sleep()
-        elif self.state == State.STANDBY:
-            self._state_standby()
-        elif self.state == State.HIBERNATE:
-            self._state_hibernate()
-        elif self.state == State.LOG_UPLOAD:
-            self._state_log_upload()
-        elif self.state == State.ERROR:
-            self._state_error()
-
-    def _state_startup(self):
+                self.last_log_time = now
+
+    def _close_logs(self):
+        """Close the logs before a reset or deep sleep.
+
+        Writes queued records and, for compressed logs, the rest of the
+        deflate stream and the gzip trailer; a reset without this leaves
+        the current .gz truncated. The logger reopens new files at boot.
+        """
+        if self.data_logger:
+            self.data_logger.close()
+
+    def _run_state_machine(self, now):
+        """Execute current state.
+
+        Every state handler takes the loop's ticks_ms() value as `now`.
+
+        Args:
+            now: ticks_ms() taken at the top of this loop iteration
+        """
+        handler = self._state_dispatch.get(self.state)
+        if handler:
+            handler(now)
+
+    def _state_startup(self, now):
         """Startup state."""
         self.log.info("State: STARTUP")
 
         battery_pct = self.power.get_battery_percentage()
-        self.log.info(f"Battery: {battery_pct}%")
+        self.log.info("Battery: %s%%", battery_pct)
 
         # Skip battery critical check in test mode
         if not self._test_mode and self.power.is_battery_critical():
@@ -642,7 +843,7 @@ class PicoBeacon:
 
         self.state = State.INIT
 
-    def _state_init(self):
+    def _state_init(self, now):
         """Initialization state."""
         self.log.info("State: INIT")
 
@@ -661,25 +862,23 @@ class PicoBeacon:
 
         self.state = State.GPS_ACQUIRE
 
-    def _state_gps_acquire(self):
+    def _state_gps_acquire(self, now):
         """GPS acquisition state."""
         # RAPID 2 LED: Cyan when acquiring
         self.leds.update_gps_status(has_fix=False, acquiring=True)
 
-        self.gps.update()
-
+        # run() has already called gps.update() this iteration
         if self.gps.valid:
-            self.log.info(f"GPS fix: {self.gps.latitude:.6f}, {self.gps.longitude:.6f}")
+            self.log.info("GPS fix: %.6f, %.6f", self.gps.latitude, self.gps.longitude)
             # RAPID 2 LED: Purple when has fix
             self.leds.update_gps_status(has_fix=True)
 
-            mode = self.config.get("operating_mode", OperatingMode.ACTIVE)
-            if mode == OperatingMode.LOGGING:
+            if self._mode_logging_only:
                 self.state = State.READY
             else:
                 self.state = State.NETWORK_CONNECT
 
-    def _state_network_connect(self):
+    def _state_network_connect(self, now):
         """Network connection state."""
         if not self._rf_enabled:
             self.state = State.READY
@@ -694,23 +893,28 @@ class PicoBeacon:
             return
 
         # Use configured timeout (longer for Cat-M/NB-IoT)
-        timeout = self.config.get("connection_timeout_sec", 120)
-        if self.network.connect(timeout_sec=timeout):
-            self.log.info(f"Connected: {self.network.get_ip_address()}")
+        if self.network.connect(timeout_sec=self._connect_timeout_sec):
+            self.log.info("Connected: %s", self.network.get_ip_address())
             self.leds.update_network_status(connected=True)
             self.state = State.READY
         else:
             error = getattr(self.network, 'last_error', None) or getattr(self.network, '_last_error', 'Unknown')
-            self.log.error(f"Connect failed: {error}")
+            self.log.error("Connect failed: %s", error)
             self.retry_count += 1
 
             if self.retry_count >= Timing.MAX_RETRIES:
                 self.log.warning("Network unavailable")
                 self.state = State.READY  # Continue in logging mode
             else:
-                time.sleep_ms(Timing.CONNECT_RETRY_MS)
+                sleep_ms(self._retry_delay_ms(Timing.CONNECT_RETRY_MS))
+
+    def _state_ready_first(self, now):
+        """First READY pass: finish initialization, then run READY."""
+        self._init_deferred()
+        self._state_dispatch[State.READY] = self._state_ready
+        self._state_ready(now)
 
-    def _state_ready(self):
+    def _state_ready(self, now):
         """Ready state - waiting for next transmit."""
         # Check log upload request
         if self._log_upload_requested:
@@ -719,11 +923,11 @@ class PicoBeacon:
             return
 
         # Check GPRS command requests
-        if self.gprs_handler:
-            if self.gprs_handler.is_status_requested():
+        if self.gprs_handler and self.gprs_handler.is_any_pending():
+            if self.gprs_handler.consume_pending(self.gprs_handler.PENDING_STATUS):
                 self.state = State.TRANSMIT  # Force immediate transmit
                 return
-            if self.gprs_handler.is_locate_requested():
+            if self.gprs_handler.consume_pending(self.gprs_handler.PENDING_LOCATE):
                 self.state = State.TRANSMIT
                 return
 
@@ -734,72 +938,129 @@ class PicoBeacon:
 
         # Check time for next transmit
         report_interval = self._get_report_interval_ms()
-        elapsed = time.ticks_diff(time.ticks_ms(), self.last_transmit_time)
+        elapsed = ticks_diff(now, self.last_transmit_time)
 
         if elapsed >= report_interval or self.last_transmit_time == 0:
             if self._rf_enabled:
                 self.state = State.TRANSMIT
             else:
-                self.last_transmit_time = time.ticks_ms()
+                self.last_transmit_time = now
             return
 
-        # Update GPS
-        self.gps.update()
+        # GPS LED (run() has already called gps.update() this iteration)
         self.leds.update_gps_status(has_fix=self.gps.valid, acquiring=not self.gps.valid)
 
-        # Check network
-        if self._rf_enabled and self.network and not self.network.is_connected():
+        # Check network, at most once per _NET_CHECK_MS since is_connected()
+        # can cost an AT command round trip
+        if not (self._rf_enabled and self.network):
+            return
+        if ticks_diff(now, self._last_net_check_ms) < _NET_CHECK_MS:
+            return
+        self._last_net_check_ms = now
+        if not self.network.is_connected():
             self.leds.update_network_status(connected=False)
             self.state = State.NETWORK_CONNECT
 
-    def _state_transmit(self):
+    def _state_transmit(self, now):
         """Transmit position to server."""
         if not self._rf_enabled:
-            self.last_transmit_time = time.ticks_ms()
+            self.last_transmit_time = ticks_ms()
             self.state = State.READY
             return
 
         self.log.info("State: TRANSMIT")
-        self._update_device_status()
-
-        gps_data = self.gps.get_position()
+        gps_data = self._snapshot(now)
 
         # Build message with any pending alerts
-        alert_mask = 0
-        for alert_type, _ in self._pending_alerts:
-            alert_mask |= alert_type
-        self._pending_alerts.clear()
+        self.device_status.alerts = self._pending_alerts
+        self._pending_alerts = 0
 
-        message = self.protocol.build(gps_data, self.device_status.to_dict(), alert_mask)
+        message = self._msg_buf
+        self.protocol.build_into(message, gps_data, self.device_status.to_dict())
 
-        host = self.config.get("server_host")
-        port = self.config.get("server_port")
+        host = self._server_host
+        port = self._server_port
 
         self.leds.indicate_transmit()
 
         # Use UDP for SIM7080G (TCP doesn't work with GNSS active)
-        if getattr(self, '_use_udp', False) and hasattr(self.network, 'send_udp'):
+        use_udp = self._use_udp
+        if use_udp:
+            # Resend earlier unsent reports first, so the server gets
+            # them in order
+            if self._tx_backlog:
+                self._flush_tx_backlog(host, port)
             success = self.network.send_udp(host, port, message)
         else:
-            success = self.network.send_tcp(host, port, message, timeout_ms=Timing.NETWORK_TIMEOUT_MS)
+            # Resend earlier unsent reports ahead of this one in the same
+            # write. Keep the connection open between reports; the drivers
+            # reconnect if the server has dropped it
+            payload = message
+            if self._tx_backlog:
+                payload = b"".join(self._tx_backlog) + message
+            success = self.network.send_tcp(host, port, payload,
+                                            timeout_ms=Timing.NETWORK_TIMEOUT_MS,
+                                            keepalive=True)
 
         if success:
+            if self._tx_backlog and not use_udp:
+                # The backlog went out in the same write as the report
+                self.log.info("Resent %d unsent reports", len(self._tx_backlog))
+                del self._tx_backlog[:]
             self.log.info("Transmit OK")
-            self.last_transmit_time = time.ticks_ms()
+            self.last_transmit_time = ticks_ms()
             self.retry_count = 0
             self.state = State.READY
+            # Collect the report's garbage now, while nothing is due
+            gc.collect()
         else:
             error = getattr(self.network, 'last_error', None) or getattr(self.network, '_last_error', 'Unknown')
-            self.log.error(f"Transmit failed: {error}")
+            self.log.error("Transmit failed: %s", error)
             self.retry_count += 1
 
             if self.retry_count >= Timing.MAX_RETRIES:
+                self._queue_tx_backlog(message)
                 self.state = State.NETWORK_CONNECT
                 self.retry_count = 0
             else:
-                time.sleep_ms(1000)
+                sleep_ms(self._retry_delay_ms(1000))
+
+    def _queue_tx_backlog(self, message):
+        """Keep a copy of a report that could not be sent.
+
+        Drops the oldest report once _TX_BACKLOG_MAX are queued.
+        """
+        if len(self._tx_backlog) >= _TX_BACKLOG_MAX:
+            self._tx_backlog.pop(0)
+        self._tx_backlog.append(bytes(message))
+
+    def _flush_tx_backlog(self, host, port):
+        """Resend queued reports over UDP, oldest first.
 
-    def _state_sleep(self):
+        Each report is its own datagram. Called before the current report
+        is sent; stops at the first failure and keeps the rest queued for
+        the next transmit.
+        """
+        count = 0
+        while self._tx_backlog:
+            if not self.network.send_udp(host, port, self._tx_backlog[0]):
+                break
+            self._tx_backlog.pop(0)
+            count += 1
+        if count:
+            self.log.info("Resent %d unsent reports", count)
+
+    def _retry_delay_ms(self, base_ms):
+        """Get the backoff delay before the next retry.
+
+        Doubles per consecutive failure (retry_count) up to _RETRY_MAX_MS,
+        plus up to ~1 s of jitter so beacons deployed together do not
+        retry in lockstep.
+        """
+        delay = min(_RETRY_MAX_MS, base_ms << min(self.retry_count - 1, 5))
+        return delay + random.getrandbits(10)
+
+    def _state_sleep(self, now):
         """Sleep state between reports."""
         # Skip sleep in test mode
         if self._test_mode:
@@ -811,14 +1072,16 @@ class PicoBeacon:
 
         interval_ms = self._get_report_interval_ms()
 
-        if self.config.get("deep_sleep_enabled", False):
-            self.power.deep_sleep(interval_ms)
-        else:
-            self.power.light_sleep(interval_ms)
+        # Deep sleep resets the device, so only use it for long stopped
+        # intervals; a moving beacon would reboot on every report
+        allow_deep = self._deep_sleep_enabled and not self._is_moving
+        if self.power.uses_deep_sleep(interval_ms // 1000, allow_deep):
+            self._close_logs()
+        self.power.sleep_until_next_report(interval_ms // 1000, allow_deep)
 
         self.state = State.GPS_ACQUIRE
 
-    def _state_standby(self):
+    def _state_standby(self, now):
         """Standby mode - low power with periodic wake."""
         # Skip standby in test mode - return to active
         if self._test_mode:
@@ -854,12 +1117,12 @@ class PicoBeacon:
 
         # Periodic check-in
         report_interval = self._get_report_interval_ms()
-        elapsed = time.ticks_diff(time.ticks_ms(), self.last_transmit_time)
+        elapsed = ticks_diff(ticks_ms(), self.last_transmit_time)
 
         if elapsed >= report_interval:
             self.state = State.GPS_ACQUIRE
 
-    def _state_hibernate(self):
+    def _state_hibernate(self, now):
         """Hibernate mode - deep sleep with command-only wake."""
         # Skip hibernate in test mode - return to active
         if self._test_mode:
@@ -873,7 +1136,8 @@ class PicoBeacon:
 
         wake_interval = self.config.get("hibernate_wake_interval_hr", 24) * 3600 * 1000
 
-        if self.config.get("deep_sleep_enabled", False):
+        if self._deep_sleep_enabled:
+            self._close_logs()
             self.power.deep_sleep(wake_interval)
         else:
             self.power.light_sleep(wake_interval)
@@ -883,7 +1147,7 @@ class PicoBeacon:
 
         self.state = State.GPS_ACQUIRE
 
-    def _state_log_upload(self):
+    def _state_log_upload(self, now):
         """Upload stored logs to server."""
         self.log.info("State: LOG_UPLOAD")
 
@@ -893,15 +1157,16 @@ class PicoBeacon:
 
         # Get log files
         log_files = self.data_logger.get_log_files()
-        self.log.info(f"Uploading {len(log_files)} log files...")
+        self.log.info("Uploading %d log files...", len(log_files))
 
         # TODO: Implement log upload protocol
 
         self.state = State.READY
+        gc.collect()
 
-    def _state_error(self):
+    def _state_error(self, now):
         """Error state."""
-        self.log.error(f"State: ERROR - {self.error_message}")
+        self.log.error("State: ERROR - %s", self.error_message)
 
         self.leds.error_on()
         self.leds.gps_off()
@@ -917,17 +1182,31 @@ class PicoBeacon:
             self.leds.error_off()
             self.state = State.INIT
 
-    def _update_device_status(self):
+    def _snapshot(self, now):
+        """Refresh the GPS position and device status for this loop pass.
+
+        A transmit and a log record due in the same pass share one
+        refresh.
+
+        Args:
+            now: ticks_ms() taken at the top of this loop iteration
+
+        Returns:
+            dict: The shared position dict from gps.get_position_into()
+        """
+        if now != self._snapshot_ms:
+            self._snapshot_ms = now
+            self.gps.get_position_into(self._gps_data)
+            self._update_device_status(now)
+        return self._gps_data
+
+    def _update_device_status(self, now):
         """Update device status."""
         self.device_status.battery = self.power.get_battery_percentage()
 
-        if hasattr(self.network, 'get_cell_info'):
-            cell_info = self.network.get_cell_info()
-            self.device_status.rssi = cell_info.get('rssi', 0)
-            self.device_status.lac = cell_info.get('lac', 0)
-            self.device_status.cell_id = cell_info.get('cell_id', 0)
-        elif hasattr(self.network, 'get_rssi'):
-            self.device_status.rssi = self.network.get_rssi()
+        if self._cell_info_ms is None or ticks_diff(now, self._cell_info_ms) >= _CELL_INFO_TTL_MS:
+            self._cell_info_ms = now
+            self._update_network_status()
 
         self.device_status.motion = 1 if self._is_moving else 0
 
@@ -935,12 +1214,27 @@ class PicoBeacon:
             self.device_status.input_state = 1 if self.io_controller.get_input_state() else 0
             self.device_status.output_state = 1 if self.io_controller.get_output_state() else 0
 
+    def _update_network_status(self):
+        """Update RSSI and cell info in device status.
+
+        These cost a modem AT round trip, so _update_device_status() only
+        calls this every _CELL_INFO_TTL_MS; device_status keeps the last
+        values in between.
+        """
+        if self._net_get_cell_info:
+            cell_info = self._net_get_cell_info()
+            self.device_status.rssi = cell_info.get('rssi', 0)
+            self.device_status.lac = cell_info.get('lac', 0)
+            self.device_status.cell_id = cell_info.get('cell_id', 0)
+        elif self._net_get_rssi:
+            self.device_status.rssi = self._net_get_rssi()
+
     def _send_sms_response(self, message):
         """Send SMS response (if cellular network)."""
-        if hasattr(self.network, 'send_sms'):
+        if self._net_send_sms:
             dest = self.config.get("sms_destination", "")
             if dest:
-                self.network.send_sms(dest, message)
+                self._net_send_sms(dest, message)
 
 
 def main():
@@ -962,7 +1256,7 @@ def main():
 
         while True:
             led.toggle()
-            time.sleep_ms(100)
+            sleep_ms(100)
 
 
 if __name__ == "__main__":
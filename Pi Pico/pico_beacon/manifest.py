@@ -0,0 +1,22 @@
+# Pico Beacon - MicroPython Freeze Manifest
+# Builds the beacon modules into the firmware as frozen bytecode, so they
+# import straight from flash instead of being compiled onto the heap at boot.
+#
+# Build from the MicroPython rp2 port directory:
+#   make BOARD=RPI_PICO_W FROZEN_MANIFEST=/path/to/pico_beacon/manifest.py
+#
+# sys.path searches the filesystem before ".frozen", so remove these
+# modules from the board's flash after installing the firmware, leaving
+# only boot.py and config.json. A frozen main.py still runs at boot.
+
+# The board's own manifest pulls in the port modules plus board extras
+# (e.g. the network and cyw43 modules on RPI_PICO_W)
+include("$(BOARD_DIR)/manifest.py")
+
+module("main.py")
+module("config.py")
+
+package("drivers")
+package("handlers")
+package("protocol")
+package("utils")
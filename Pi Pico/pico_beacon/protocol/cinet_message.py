@@ -47,10 +47,29 @@ class CiNetMessage:
         # Pre-allocate message buffer
         self._buffer = bytearray(self.MSG_LENGTH)
 
+        # Header bytes 0-45 never change apart from the sequence number,
+        # so build them once and copy them into each message
+        self._header = bytearray(46)
+        self._build_header_template(self._header)
+
     def build(self, gps_data, device_status=None):
-        """Build a complete ciNet message.
+        """Build a complete ciNet message into the internal buffer.
+
+        Same arguments as build_into().
+
+        Returns:
+            bytearray: Complete 149-byte message ready to send (reused by
+            the next call)
+        """
+        self.build_into(self._buffer, gps_data, device_status)
+        return self._buffer
+
+    def build_into(self, buf, gps_data, device_status=None):
+        """Build a complete ciNet message into a caller-owned buffer.
 
         Args:
+            buf: bytearray of at least MSG_LENGTH bytes
+
             gps_data: dict with GPS data:
                 - latitude: float (degrees, negative for S)
                 - longitude: float (degrees, negative for W)
@@ -67,12 +86,11 @@ class CiNetMessage:
                 - temperature: int (Celsius)
                 - rssi: int (signal strength)
                 - motion: int (motion state)
+                - alerts: int (AlertType bit mask)
 
         Returns:
-            bytearray: Complete 149-byte message ready to send
+            int: Message length (MSG_LENGTH)
         """
-        buf = self._buffer
-
         # Increment sequence number (0-255)
         self.sequence = (self.sequence + 1) & 0xFF
 
@@ -105,10 +123,21 @@ class CiNetMessage:
         buf[147] = (~crc_value) & 0xFF
         buf[148] = (~(crc_value >> 8)) & 0xFF
 
-        return buf
+        return self.MSG_LENGTH
 
     def _build_header(self, buf, datong_ts):
         """Build the plain-text header (bytes 0-50)."""
+        # Bytes 0-45: Fixed header from the template
+        buf[0:46] = self._header
+
+        # Byte 4: Sequence number
+        buf[4] = self.sequence
+
+        # Bytes 46-50: Datong timestamp (5 bytes)
+        buf[46:51] = datong_ts
+
+    def _build_header_template(self, buf):
+        """Build the fixed header bytes 0-45 (sequence number left 0)."""
         # Byte 0: Start byte
         buf[0] = self.START_BYTE
 
@@ -118,9 +147,6 @@ class CiNetMessage:
         # Bytes 2-3: Message length (big-endian)
         pack2(buf, 2, self.MSG_LENGTH)
 
-        # Byte 4: Sequence number
-        buf[4] = self.sequence
-
         # Bytes 5-8: ciNet key (big-endian)
         pack4(buf, 5, self._cinet_key)
 
@@ -133,9 +159,6 @@ class CiNetMessage:
         # Bytes 22-45: Source ID / Serial number (24 bytes)
         buf[22:46] = self._serial
 
-        # Bytes 46-50: Datong timestamp (5 bytes)
-        buf[46:51] = datong_ts
-
     def _build_payload(self, buf, gps_data, device_status, datong_ts):
         """Build the encrypted payload (bytes 51-146)."""
         status = device_status or {}
@@ -373,22 +396,29 @@ class DeviceStatus:
         self.input_state = 0
         self.alerts = 0
 
+        # Refilled by to_dict() instead of allocating a new dict per call
+        self._dict = {}
+
     def to_dict(self):
-        """Convert to dictionary for message builder."""
-        return {
-            'battery': self.battery,
-            'temperature': self.temperature,
-            'rssi': self.rssi,
-            'motion': self.motion,
-            'status_flags': self.status_flags,
-            'lac': self.lac,
-            'cell_id': self.cell_id,
-            'act': self.act,
-            'beacon_mode': self.beacon_mode,
-            'motion_sensitivity': self.motion_sensitivity,
-            'wake_trigger': self.wake_trigger,
-            'output_state': self.output_state,
-            'geozone': self.geozone,
-            'input_state': self.input_state,
-            'alerts': self.alerts
-        }
+        """Convert to dictionary for message builder.
+
+        The same dict is refilled and returned on every call, so callers
+        must not hold on to it across calls.
+        """
+        d = self._dict
+        d['battery'] = self.battery
+        d['temperature'] = self.temperature
+        d['rssi'] = self.rssi
+        d['motion'] = self.motion
+        d['status_flags'] = self.status_flags
+        d['lac'] = self.lac
+        d['cell_id'] = self.cell_id
+        d['act'] = self.act
+        d['beacon_mode'] = self.beacon_mode
+        d['motion_sensitivity'] = self.motion_sensitivity
+        d['wake_trigger'] = self.wake_trigger
+        d['output_state'] = self.output_state
+        d['geozone'] = self.geozone
+        d['input_state'] = self.input_state
+        d['alerts'] = self.alerts
+        return d
@@ -1,6 +1,17 @@
 # CRC16 implementation for ciNet protocol
 # Ported from original Millitag Python code
 
+from array import array
+
+try:
+    import micropython
+except ImportError:
+    # Host Python: the code emitter decorator becomes a no-op
+    class micropython:
+        viper = staticmethod(lambda f: f)
+
+    ptr8 = ptr16 = bytearray
+
 # CRC16 lookup table (CCITT polynomial)
 CRC16_TABLE = [
     0x0000, 0x1189, 0x2312, 0x329B, 0x4624, 0x57AD, 0x6536, 0x74BF,
@@ -37,6 +48,19 @@ CRC16_TABLE = [
     0x7BC7, 0x6A4E, 0x58D5, 0x495C, 0x3DE3, 0x2C6A, 0x1EF1, 0x0F78
 ]
 
+# Packed copy of the table for _crc16_update's ptr16 access
+_TABLE = array('H', CRC16_TABLE)
+
+
+@micropython.viper
+def _crc16_update(crc: int, data: ptr8, start: int, end: int, table: ptr16) -> int:
+    """Run the table-driven CRC16 over data[start:end], starting from crc."""
+    i = start
+    while i < end:
+        crc = table[(crc ^ data[i]) & 0xFF] ^ (crc >> 8)
+        i += 1
+    return crc
+
 
 class CRC16:
     """CRC16 calculator for ciNet protocol."""
@@ -53,10 +77,7 @@ class CRC16:
         if length is None:
             length = len(data) - offset
 
-        for i in range(offset, offset + length):
-            self.value ^= data[i]
-            self.value = CRC16_TABLE[self.value & 0xFF] ^ (self.value >> 8)
-
+        self.value = _crc16_update(self.value, data, offset, offset + length, _TABLE)
         return self.value
 
     @staticmethod
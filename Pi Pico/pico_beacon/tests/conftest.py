@@ -0,0 +1,50 @@
+# Host test setup for Pico Beacon
+# Provides the MicroPython-only modules and time functions that the
+# drivers, handlers and utils import, so they can be tested on desktop
+# Python. Tests that need real behaviour pass their own fakes (e.g. UART).
+
+import sys
+import os
+import time
+import types
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _AnyConstant(type):
+    """Class attributes such as Pin.OUT or Timer.PERIODIC read as 0."""
+
+    def __getattr__(cls, name):
+        return 0
+
+
+class _Peripheral(metaclass=_AnyConstant):
+    """Stand-in for a machine peripheral; every method is a no-op."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+if "machine" not in sys.modules:
+    try:
+        import machine  # noqa: F401
+    except ImportError:
+        machine = types.ModuleType("machine")
+        machine.Pin = machine.UART = machine.Timer = machine.ADC = _Peripheral
+        machine.I2C = machine.SPI = machine.PWM = machine.RTC = _Peripheral
+        machine.WDT = _Peripheral
+        machine.lightsleep = machine.deepsleep = lambda *args: None
+        machine.reset = lambda: None
+        machine.unique_id = lambda: b"\x00\x00\x00\x00"
+        sys.modules["machine"] = machine
+
+# MicroPython time extensions
+if not hasattr(time, "ticks_ms"):
+    time.ticks_ms = lambda: int(time.monotonic() * 1000)
+    time.ticks_diff = lambda a, b: a - b
+    time.ticks_add = lambda a, b: a + b
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
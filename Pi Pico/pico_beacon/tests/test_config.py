@@ -0,0 +1,172 @@
+# Configuration Tests for Pico Beacon
+# Exercises ConfigManager change tracking and batched saves
+#
+# Run on desktop Python (not MicroPython) for testing:
+#   python -m pytest tests/test_config.py -v
+
+import json
+
+import pytest
+
+import config
+from config import ConfigManager
+
+
+def make_config(tmp_path, monkeypatch):
+    """Build a ConfigManager on a temp file, counting writes to it.
+
+    Returns:
+        tuple: (ConfigManager, list of paths written, one per save)
+    """
+    path = str(tmp_path / "config.json")
+    monkeypatch.setattr(ConfigManager, "CONFIG_FILE", path)
+    writes = []
+
+    def counting_open(file, mode='r', *args, **kwargs):
+        if 'w' in mode:
+            writes.append(file)
+        return open(file, mode, *args, **kwargs)
+
+    # Shadows the builtin for config.py only
+    monkeypatch.setattr(config, "open", counting_open, raising=False)
+    return ConfigManager(), writes
+
+
+def test_batch_saves_once(tmp_path, monkeypatch):
+    """Saves inside a batch are deferred to a single write."""
+    cfg, writes = make_config(tmp_path, monkeypatch)
+
+    cfg.begin_batch()
+    cfg.set("sms_enabled", True)
+    cfg.save()
+    cfg.set("logging_rate_sec", 30)
+    cfg.save()
+    assert writes == [], "Saves inside a batch should be deferred"
+
+    assert cfg.commit_batch()
+    assert len(writes) == 1, f"Expected one write, got {len(writes)}"
+    with open(cfg.CONFIG_FILE) as f:
+        saved = json.load(f)
+    assert saved["sms_enabled"] is True
+    assert saved["logging_rate_sec"] == 30
+
+
+def test_nested_batch_saves_once(tmp_path, monkeypatch):
+    """Only the outermost commit_batch() writes."""
+    cfg, writes = make_config(tmp_path, monkeypatch)
+
+    cfg.begin_batch()
+    cfg.begin_batch()
+    cfg.set("sms_enabled", True)
+    cfg.save()
+    cfg.commit_batch()
+    assert writes == [], "Inner commit_batch() should not write"
+
+    cfg.set("logging_rate_sec", 30)
+    cfg.save()
+    cfg.commit_batch()
+    assert len(writes) == 1, f"Expected one write, got {len(writes)}"
+
+
+def test_batch_without_changes_does_not_save(tmp_path, monkeypatch):
+    """A batch with no save() requested leaves flash alone."""
+    cfg, writes = make_config(tmp_path, monkeypatch)
+
+    cfg.begin_batch()
+    assert cfg.commit_batch()
+    assert writes == [], "Empty batch should not write"
+
+    # A stray commit_batch() outside any batch does not write either
+    assert cfg.commit_batch()
+    assert writes == []
+
+
+def test_set_reports_change(tmp_path, monkeypatch):
+    """set() returns True only when the stored value changes."""
+    cfg, _ = make_config(tmp_path, monkeypatch)
+    version = cfg.version
+
+    assert cfg.set("logging_rate_sec", 30), "New value should report a change"
+    assert cfg.get("logging_rate_sec") == 30
+    assert cfg.version == version + 1
+
+    assert not cfg.set("logging_rate_sec", 30), "Same value is not a change"
+    assert cfg.version == version + 1, "Unchanged set() should not bump version"
+
+
+def test_set_new_key_reports_change(tmp_path, monkeypatch):
+    """A key missing from the config counts as changed, even set to None."""
+    cfg, _ = make_config(tmp_path, monkeypatch)
+
+    assert cfg.set("output_state", None)
+    assert not cfg.set("output_state", None)
+
+
+def test_set_type_change_reports_change(tmp_path, monkeypatch):
+    """Equal values of a different type are still a change."""
+    cfg, _ = make_config(tmp_path, monkeypatch)
+
+    # As if loaded from a config.json holding 1 instead of true
+    cfg.config["sms_enabled"] = 1
+    assert cfg.set("sms_enabled", True), "int 1 -> True should be a change"
+    assert cfg.get("sms_enabled") is True
+    assert not cfg.set("sms_enabled", True)
+
+    cfg.config["logging_rate_sec"] = 30
+    assert cfg.set("logging_rate_sec", 30.0), "int -> float should be a change"
+
+
+def test_update_reports_any_change(tmp_path, monkeypatch):
+    """update() is True if any one of its values changed."""
+    cfg, _ = make_config(tmp_path, monkeypatch)
+    rate = cfg.get("logging_rate_sec")
+
+    assert not cfg.update({"logging_rate_sec": rate})
+    assert cfg.update({"logging_rate_sec": rate, "sms_enabled": True})
+
+
+def test_transaction_saves_once(tmp_path, monkeypatch):
+    """A transaction block writes once when it ends."""
+    cfg, writes = make_config(tmp_path, monkeypatch)
+
+    with cfg.transaction():
+        cfg.set("sms_enabled", True)
+        cfg.save()
+        cfg.set("logging_rate_sec", 30)
+        cfg.save()
+        assert writes == [], "Saves inside the block should be deferred"
+
+    assert len(writes) == 1, f"Expected one write, got {len(writes)}"
+
+
+def test_transaction_commits_on_exception(tmp_path, monkeypatch):
+    """A raising block still saves its earlier changes and re-raises."""
+    cfg, writes = make_config(tmp_path, monkeypatch)
+
+    with pytest.raises(ValueError):
+        with cfg.transaction():
+            cfg.set("sms_enabled", True)
+            cfg.save()
+            raise ValueError("bad command")
+
+    assert len(writes) == 1, "Changes before the exception should be saved"
+    with open(cfg.CONFIG_FILE) as f:
+        assert json.load(f)["sms_enabled"] is True
+
+    # The batch was closed, so later saves are not deferred
+    cfg.set("logging_rate_sec", 30)
+    cfg.save()
+    assert len(writes) == 2, "save() after the block should write at once"
+
+
+def test_transaction_exception_without_save(tmp_path, monkeypatch):
+    """A block that raises before any save() does not write."""
+    cfg, writes = make_config(tmp_path, monkeypatch)
+
+    with pytest.raises(ValueError):
+        with cfg.transaction():
+            cfg.set("sms_enabled", True)
+            raise ValueError("bad command")
+
+    assert writes == []
+    assert cfg.get("sms_enabled") is True, "There is no rollback"
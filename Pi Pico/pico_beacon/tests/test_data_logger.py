@@ -0,0 +1,97 @@
+# Data Logger Tests for Pico Beacon
+# Round-trips records through the binary log and decode_records()
+#
+# Run on desktop Python (not MicroPython) for testing:
+#   python -m pytest tests/test_data_logger.py -v
+
+import os
+
+from utils.data_logger import DataLogger, decode_records, BIN_RECORD_SIZE
+
+
+def log_and_decode(tmp_path, positions, device_status=None):
+    """Log positions to a binary-only log, close it and decode the file."""
+    logger = DataLogger(log_dir=str(tmp_path), enable_csv=False,
+                        enable_bin=True)
+    for gps_data in positions:
+        assert logger.log(gps_data, device_status), "Record should be queued"
+    logger.close()
+
+    names = [name for name in os.listdir(tmp_path) if name.endswith('.bin')]
+    assert len(names) == 1, f"Expected one binary log, found {names}"
+    with open(os.path.join(tmp_path, names[0]), 'rb') as f:
+        data = f.read()
+    assert len(data) == len(positions) * BIN_RECORD_SIZE
+    return decode_records(data)
+
+
+def test_bin_round_trip(tmp_path):
+    """A record logged, flushed and decoded keeps its values."""
+    gps_data = {
+        'timestamp': (2024, 6, 15, 12, 30, 45),
+        'latitude': 51.507351,
+        'longitude': 12.345678,
+        'altitude': 35.7,
+        'speed': 12.3,
+        'satellites': 9,
+        'hdop': 1.2,
+        'valid': True,
+    }
+    records = log_and_decode(tmp_path, [gps_data], {'battery': 87})
+
+    rec = records[0]
+    assert rec['ts'] == "2024-06-15T12:30:45"
+    # Positions are queued as f32, so allow float32 rounding
+    assert abs(rec['lat'] - 51.507351) < 1e-5, rec['lat']
+    assert abs(rec['lon'] - 12.345678) < 1e-5, rec['lon']
+    assert rec['alt'] == 35
+    assert abs(rec['spd'] - 12.3) < 0.11, rec['spd']
+    assert rec['sat'] == 9
+    assert abs(rec['hdop'] - 1.2) < 0.11, rec['hdop']
+    assert rec['fix'] is True
+    assert rec['bat'] == 87
+
+
+def test_bin_round_trip_negative_position(tmp_path):
+    """Southern and western positions keep their sign."""
+    gps_data = {
+        'timestamp': (2025, 12, 31, 23, 59, 59),
+        'latitude': -33.868820,
+        'longitude': -151.209296,
+        'altitude': -12.0,
+        'valid': True,
+    }
+    rec = log_and_decode(tmp_path, [gps_data])[0]
+
+    assert rec['ts'] == "2025-12-31T23:59:59"
+    assert abs(rec['lat'] - -33.868820) < 1e-5, rec['lat']
+    assert abs(rec['lon'] - -151.209296) < 1e-5, rec['lon']
+    assert rec['alt'] == -12
+
+
+def test_bin_round_trip_sentinels(tmp_path):
+    """Out-of-range and missing fields decode to their sentinel values."""
+    gps_data = {
+        'timestamp': (2024, 1, 2, 3, 4, 5),
+        'latitude': 1.0,
+        'longitude': 2.0,
+        'satellites': 300,
+        'valid': False,
+    }
+    # No hdop (defaults to 99.9) and no battery reading
+    rec = log_and_decode(tmp_path, [gps_data])[0]
+
+    assert rec['sat'] == 255, "Satellite count should clamp to 255"
+    assert rec['hdop'] == 25.5, "HDOP x10 should clamp to 255"
+    assert rec['bat'] == -1, "Unknown battery should decode as -1"
+    assert rec['fix'] is False
+
+
+def test_bin_round_trip_order(tmp_path):
+    """Several queued records decode in the order they were logged."""
+    positions = [{'timestamp': (2024, 3, 1, 10, 0, sec),
+                  'latitude': 50.0 + sec / 100, 'longitude': -1.0,
+                  'valid': True} for sec in range(5)]
+    records = log_and_decode(tmp_path, positions)
+
+    assert [rec['ts'][-2:] for rec in records] == ["00", "01", "02", "03", "04"]
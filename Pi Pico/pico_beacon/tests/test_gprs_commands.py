@@ -0,0 +1,220 @@
+# GPRS Command Tests for Pico Beacon
+# Checks each server command against the config and state machine changes
+# it should make
+#
+# Run on desktop Python (not MicroPython) for testing:
+#   python -m pytest tests/test_gprs_commands.py -v
+
+import pytest
+
+from handlers.gprs_commands import GPRSCommandHandler as H
+from handlers.gprs_commands import _CONFIG_COMMANDS, _DISPATCH
+
+
+class FakeConfig:
+    """ConfigManager stand-in that records values and save() calls."""
+
+    def __init__(self):
+        self.values = {}
+        self.saves = 0
+
+    def set(self, key, value):
+        if self.values.get(key, object()) == value:
+            return False
+        self.values[key] = value
+        return True
+
+    def update(self, updates):
+        changed = False
+        for key, value in updates.items():
+            if self.set(key, value):
+                changed = True
+        return changed
+
+    def save(self):
+        self.saves += 1
+        return True
+
+
+class FakeStateMachine:
+    """Records the state machine methods the handler calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def can_handle_commands(self):
+        return True
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+
+class FakeLogger:
+    """DataLogger stand-in that records erase_all()."""
+
+    def __init__(self):
+        self.erased = False
+
+    def erase_all(self):
+        self.erased = True
+
+
+def make_handler():
+    """Build a handler with fake config, state machine and logger."""
+    return H(FakeConfig(), FakeStateMachine(), data_logger=FakeLogger())
+
+
+# code -> (config values set, state machine call)
+CONFIG_CASES = {
+    H.CMD_RESET_TO_CONFIG: ({"operating_mode": "active", "rf_mode": "auto",
+                             "rf_enabled": True}, ("reset_to_config", ())),
+    H.CMD_HIBERNATE: ({"operating_mode": "hibernate"}, ("enter_hibernate", ())),
+    H.CMD_STANDBY: ({"operating_mode": "standby"}, ("enter_standby", ())),
+    H.CMD_CLEAR_STANDBY: ({"operating_mode": "active"}, ("exit_standby", ())),
+    H.CMD_FOREVER_STANDBY: ({"operating_mode": "forever_standby"},
+                            ("enter_forever_standby", ())),
+    H.CMD_TAMPER_ON: ({"tamper_enabled": True, "tamper_alert_enabled": True},
+                      None),
+    H.CMD_TAMPER_OFF: ({"tamper_alert_enabled": False}, None),
+    H.CMD_RF_ON: ({"rf_enabled": True, "rf_mode": "on"},
+                  ("set_rf_enabled", (True,))),
+    H.CMD_RF_OFF: ({"rf_enabled": False, "rf_mode": "off"},
+                   ("set_rf_enabled", (False,))),
+    H.CMD_RF_AUTO: ({"rf_mode": "auto", "rf_enabled": True},
+                    ("set_rf_mode_auto", ())),
+    H.CMD_BUTTON_ENABLE: ({"button_enabled": True}, None),
+    H.CMD_BUTTON_DISABLE: ({"button_enabled": False}, None),
+}
+
+
+def test_config_cases_cover_table():
+    """Every _CONFIG_COMMANDS row has a test case."""
+    assert set(CONFIG_CASES) == set(_CONFIG_COMMANDS)
+
+
+@pytest.mark.parametrize("code", sorted(CONFIG_CASES))
+def test_config_command(code):
+    """A config command sets its keys, saves once and notifies the state machine."""
+    expected, call = CONFIG_CASES[code]
+    handler = make_handler()
+
+    assert handler.process_command(code)
+    assert handler.config.values == expected
+    assert handler.config.saves == 1
+    assert handler.state_machine.calls == ([call] if call else [])
+
+    # Repeating the command changes nothing, so nothing is written
+    assert handler.process_command(code)
+    assert handler.config.saves == 1, "Unchanged config should not be saved"
+
+
+def test_dispatch_cases_cover_table():
+    """Every _DISPATCH row has a test below."""
+    assert set(_DISPATCH) == {
+        H.CMD_STATUS, H.CMD_LOCATE, H.CMD_OUTPUT_ON, H.CMD_OUTPUT_OFF,
+        H.CMD_LOG_ERASE, H.CMD_SET_RATE, H.CMD_UPLOAD_LOG, H.CMD_REBOOT,
+        H.CMD_AUDIO_ON, H.CMD_AUDIO_OFF,
+    }
+
+
+@pytest.mark.parametrize("code, pending", [
+    (H.CMD_STATUS, H.PENDING_STATUS),
+    (H.CMD_LOCATE, H.PENDING_LOCATE),
+    (H.CMD_UPLOAD_LOG, H.PENDING_UPLOAD),
+])
+def test_pending_command(code, pending):
+    """Status, locate and upload requests are left pending for the main loop."""
+    handler = make_handler()
+    assert handler.process_command(code)
+    assert handler.consume_pending(pending)
+    assert not handler.is_any_pending()
+
+
+def test_upload_log_notifies_state_machine():
+    """UPLOAD_LOG also asks the state machine to start the upload."""
+    handler = make_handler()
+    assert handler.process_command(H.CMD_UPLOAD_LOG)
+    assert handler.state_machine.calls == [("request_log_upload", ())]
+
+
+@pytest.mark.parametrize("code, state", [
+    (H.CMD_OUTPUT_ON, True),
+    (H.CMD_OUTPUT_OFF, False),
+])
+def test_output_command(code, state):
+    """Without an I/O controller the output state is kept in config."""
+    handler = make_handler()
+    assert handler.process_command(code)
+    assert handler.config.values == {"output_state": state}
+
+
+def test_log_erase():
+    """LOG_ERASE erases the data logger's files."""
+    handler = make_handler()
+    assert handler.process_command(H.CMD_LOG_ERASE)
+    assert handler.logger.erased
+
+
+@pytest.mark.parametrize("payload, key, value", [
+    (b"\x01\x00\x1e", "gprs_rate_moving_sec", 30),
+    (b"\x02\x01\x2c", "gprs_rate_stopped_sec", 300),
+    (b"\x03\x0e\x10", "gprs_rate_standby_sec", 3600),
+])
+def test_set_rate(payload, key, value):
+    """SET_RATE stores the big-endian rate under its rate type's key."""
+    handler = make_handler()
+    assert handler.process_command(H.CMD_SET_RATE, payload)
+    assert handler.config.values == {key: value}
+    assert handler.config.saves == 1
+
+
+@pytest.mark.parametrize("payload", [None, b"\x01\x00", b"\x09\x00\x1e"])
+def test_set_rate_rejects_bad_payload(payload):
+    """A short payload or unknown rate type changes nothing."""
+    handler = make_handler()
+    assert not handler.process_command(H.CMD_SET_RATE, payload)
+    assert handler.config.values == {}
+
+
+def test_reboot():
+    """REBOOT goes through the state machine rather than machine.reset()."""
+    handler = make_handler()
+    assert handler.process_command(H.CMD_REBOOT)
+    assert handler.state_machine.calls == [("request_reboot", ())]
+
+
+@pytest.mark.parametrize("code", [H.CMD_AUDIO_ON, H.CMD_AUDIO_OFF])
+def test_audio_accepted(code):
+    """Audio commands are accepted and ignored (no audio on Pico)."""
+    handler = make_handler()
+    assert handler.process_command(code)
+    assert handler.config.values == {}
+    assert handler.state_machine.calls == []
+
+
+def test_unknown_command():
+    """An unknown code is rejected and logged by drain_events()."""
+    handler = make_handler()
+    handler.drain_events()
+
+    assert not handler.process_command(0x7E)
+    assert handler.config.values == {}
+    assert handler.drain_events() == 1
+
+
+def test_handler_error_keeps_no_exception():
+    """A failing handler queues the exception's name, not the exception."""
+    from handlers import gprs_commands
+
+    handler = make_handler()
+    handler.drain_events()
+
+    def failing_erase():
+        raise OSError(5)
+
+    handler.logger.erase_all = failing_erase
+    assert not handler.process_command(H.CMD_LOG_ERASE)
+
+    detail = gprs_commands._events[-1][3]
+    assert detail == "OSError", f"Expected the class name, got {detail!r}"
+    assert handler.drain_events() == 1
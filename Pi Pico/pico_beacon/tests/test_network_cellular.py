@@ -0,0 +1,157 @@
+# Cellular Driver Tests for Pico Beacon
+# Exercises AT command handling against a fake UART
+#
+# Run on desktop Python (not MicroPython) for testing:
+#   python -m pytest tests/test_network_cellular.py -v
+
+import time
+
+from drivers.network_cellular import CellularDriver
+
+
+def test_driver_without_pollable_uart():
+    """A UART poll() rejects leaves the driver on timed polling."""
+    driver = CellularDriver(pwr_pin=None)
+    assert driver._poll is None, "Unpollable UART should disable poll"
+
+
+class FakeUART:
+    """UART stand-in that answers each written command with a reply."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.written = []
+        self._rx = b""
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        if self.replies:
+            self._rx += self.replies.pop(0)
+
+    def any(self):
+        return len(self._rx)
+
+    def read(self, n):
+        data, self._rx = self._rx[:n], self._rx[n:]
+        return data
+
+    def readinto(self, buf):
+        n = min(len(buf), len(self._rx))
+        buf[:n] = self._rx[:n]
+        self._rx = self._rx[n:]
+        return n
+
+
+def make_driver(replies):
+    """Build a driver talking to a FakeUART with the given replies."""
+    driver = CellularDriver(pwr_pin=None)
+    driver.uart = FakeUART(replies)
+    driver._poll = None
+    return driver
+
+
+def test_send_at_sees_ok():
+    """An OK reply completes the command well inside its timeout."""
+    driver = make_driver([b"\r\nOK\r\n"])
+
+    start = time.ticks_ms()
+    ok, resp = driver._send_at("AT", timeout_ms=2000)
+    elapsed = time.ticks_diff(time.ticks_ms(), start)
+
+    assert ok, "OK reply should succeed"
+    assert resp == b"\r\nOK\r\n"
+    assert elapsed < 1000, f"Waited {elapsed} ms for a reply already received"
+    assert driver.uart.written == [b"AT\r\n"]
+
+
+def test_send_at_sees_error():
+    """An ERROR reply fails the command without waiting out the timeout."""
+    driver = make_driver([b"\r\nERROR\r\n"])
+
+    start = time.ticks_ms()
+    ok, resp = driver._send_at("AT+CGACT?", timeout_ms=2000)
+    elapsed = time.ticks_diff(time.ticks_ms(), start)
+
+    assert not ok, "ERROR reply should fail"
+    assert resp == b"\r\nERROR\r\n"
+    assert elapsed < 1000, f"Waited {elapsed} ms after ERROR"
+
+
+def test_send_batch_sleeps_without_poll(monkeypatch):
+    """With no poller, waiting on a silent modem sleeps between polls."""
+    driver = make_driver([])
+    sleeps = []
+    real_sleep_ms = time.sleep_ms
+
+    def counting_sleep_ms(ms):
+        sleeps.append(ms)
+        real_sleep_ms(ms)
+
+    monkeypatch.setattr(time, "sleep_ms", counting_sleep_ms)
+    results = driver._send_batch([("AT+CFUN=1", 50, b"OK")])
+
+    assert results[0][0] is False, "No reply should time out"
+    assert sleeps and min(sleeps) > 0, "Wait should sleep, not busy-spin"
+
+
+def test_send_batch_sees_each_ok():
+    """Each pipelined command finishes on its own terminator."""
+    driver = make_driver([b"\r\nOK\r\n", b"\r\n+CSQ: 20,0\r\n\r\nOK\r\n"])
+    results = driver._send_batch([("ATE0", 1000, b"OK"),
+                                  ("AT+CSQ", 1000, b"OK")])
+    assert [ok for ok, _ in results] == [True, True]
+    assert b"+CSQ: 20,0" in results[1][1]
+
+
+def make_tcp_driver(replies):
+    """Build a connected SIM800 driver with a kept-alive link open."""
+    driver = make_driver(replies)
+    driver._connected = True
+    driver._at_dialect = "sim800"
+    driver._tcp_peer = ("server", 5000)
+    return driver
+
+
+def test_send_tcp_reopens_after_close_urc():
+    """A CLOSED URC buffered since the last send forces a fresh link."""
+    driver = make_tcp_driver([b"\r\nOK\r\n\r\nCONNECT OK\r\n",
+                              b"\r\n> ", b"\r\nSEND OK\r\n"])
+    driver.uart._rx = b"\r\nCLOSED\r\n"
+
+    assert driver.send_tcp("server", 5000, b"report", keepalive=True)
+    assert driver.uart.written[0].startswith(b"AT+CIPSTART"), \
+        "Link closed by the server should be reopened"
+    assert driver.uart.written[-1] == b"report"
+    assert driver._tcp_peer == ("server", 5000)
+
+
+def test_send_tcp_reuses_open_link():
+    """An open link is reused without reconnecting."""
+    driver = make_tcp_driver([b"\r\n> ", b"\r\nSEND OK\r\n"])
+
+    assert driver.send_tcp("server", 5000, b"report", keepalive=True)
+    assert driver.uart.written == [b"AT+CIPSEND=6\r\n", b"report"]
+
+
+def test_send_tcp_retries_dead_link():
+    """A reused link that refuses the send prompt is reopened once."""
+    driver = make_tcp_driver([b"\r\nERROR\r\n", b"\r\nOK\r\n",
+                              b"\r\nOK\r\n\r\nCONNECT OK\r\n",
+                              b"\r\n> ", b"\r\nSEND OK\r\n"])
+
+    assert driver.send_tcp("server", 5000, b"report", keepalive=True)
+    assert driver.uart.written[1] == b"AT+CIPCLOSE=0\r\n"
+    assert driver.uart.written[2].startswith(b"AT+CIPSTART")
+    assert driver.uart.written[-1] == b"report"
+
+
+def test_send_tcp_no_wait_ack_without_keepalive():
+    """wait_ack=False is ignored when the link is closed after the send."""
+    driver = make_tcp_driver([b"\r\n> ", b"\r\nSEND FAIL\r\nERROR\r\n",
+                              b"\r\nOK\r\n"])
+
+    ok = driver.send_tcp("server", 5000, b"report", wait_ack=False)
+    assert not ok, "Failed send should be reported, not deferred"
+    assert not driver._pending_send_ok
+    assert driver.uart.written[-1] == b"AT+CIPCLOSE=0\r\n"
+    assert driver._tcp_peer is None
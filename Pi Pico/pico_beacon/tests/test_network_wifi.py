@@ -0,0 +1,49 @@
+# WiFi Driver Tests for Pico Beacon
+# Exercises the persistent TCP connection checks on a local socket pair
+#
+# Run on desktop Python (not MicroPython) for testing:
+#   python -m pytest tests/test_network_wifi.py -v
+
+import socket
+
+from drivers.network_wifi import WiFiDriver
+
+
+def make_driver():
+    """Build a driver holding one end of a connected socket pair."""
+    driver = WiFiDriver()
+    driver._tcp_sock, server = socket.socketpair()
+    driver._tcp_peer = ("server", 5000)
+    return driver, server
+
+
+def test_tcp_alive_on_open_connection():
+    """An idle open connection is reused."""
+    driver, server = make_driver()
+    try:
+        assert driver._tcp_alive(), "Open connection should be reusable"
+    finally:
+        server.close()
+        driver._close_tcp()
+
+
+def test_tcp_alive_discards_unsolicited_data():
+    """Bytes from the server do not make the connection look closed."""
+    driver, server = make_driver()
+    try:
+        server.send(b"ack")
+        assert driver._tcp_alive(), "Readable data is not a close"
+        assert driver._tcp_alive(), "Data should have been drained"
+    finally:
+        server.close()
+        driver._close_tcp()
+
+
+def test_tcp_alive_after_server_close():
+    """A connection the server has closed is not reused."""
+    driver, server = make_driver()
+    server.close()
+    try:
+        assert not driver._tcp_alive(), "Closed connection must reconnect"
+    finally:
+        driver._close_tcp()
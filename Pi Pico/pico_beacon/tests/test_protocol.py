@@ -229,6 +229,24 @@ def test_message_sequence():
     assert seq3 == (seq2 + 1) & 0xFF, "Sequence should continue incrementing"
 
 
+def test_message_build_into():
+    """Test build_into fills a caller buffer identically to build."""
+    gps_data = {
+        'latitude': 53.82720,
+        'longitude': -1.66470,
+        'valid': True,
+        'timestamp': (2024, 12, 26, 4, 37, 0)
+    }
+
+    expected = bytes(CiNetMessage(MockConfig()).build(gps_data, {'alerts': 0x10}))
+
+    buf = bytearray(CiNetMessage.MSG_LENGTH)
+    length = CiNetMessage(MockConfig()).build_into(buf, gps_data, {'alerts': 0x10})
+
+    assert length == 149, "build_into should return the message length"
+    assert bytes(buf) == expected, "build_into should match build"
+
+
 def test_coordinate_encoding():
     """Test GPS coordinate encoding."""
     # Positive latitude
@@ -259,6 +277,7 @@ def run_all_tests():
         test_datong_timestamp,
         test_coordinate_encoding,
         test_message_build,
+        test_message_build_into,
         test_message_sequence,
     ]
 
@@ -2,9 +2,80 @@
 # Logs GPS positions to flash storage or SD card for offline tracking
 
 import os
+import struct
 import time
 import json
 
+try:
+    import deflate
+except ImportError:
+    # Firmware without the deflate module (or host Python)
+    deflate = None
+
+CSV_HEADER = "timestamp,latitude,longitude,altitude,speed,heading,satellites,hdop,valid,battery\n"
+
+# %-format templates for log records (formatted in C, unlike f-strings)
+_TS_FMT = "%04d-%02d-%02dT%02d:%02d:%02d"
+_CSV_FMT = "%s,%.6f,%.6f,%.1f,%.1f,%s,%s,%.1f,%d,%s\n"
+_JSON_FMT = ('{"ts": "%s", "lat": %.6f, "lon": %.6f, "alt": %.1f, "spd": %.1f, '
+             '"hdg": %s, "sat": %s, "hdop": %.1f, "fix": %s, "bat": %s}\n')
+
+# Binary record (little-endian, 20 bytes):
+#   packed GPS date/time (u32, see _pack_time), latitude and longitude in
+#   1e-7 degrees (i32), altitude m (i16), speed 0.1 km/h (u16),
+#   satellites (u8), HDOP x10 (u8), flags (u8, bit 0 = valid fix),
+#   battery % (i8, -1 = unknown)
+BIN_RECORD_FMT = "<IiihHBBBb"
+BIN_RECORD_SIZE = struct.calcsize(BIN_RECORD_FMT)
+
+# Queued record in RAM awaiting flush_pending() (little-endian, 36 bytes):
+#   packed GPS date/time (u32, 0 = none), ticks_ms when logged (u32),
+#   latitude, longitude, altitude, speed, heading (NaN = unknown) and HDOP
+#   (f32, the native float width on rp2), satellites (u8), flags (u8,
+#   bit 0 = valid fix), battery % (i8, -1 = unknown)
+_QUEUE_FMT = "<IIffffffBBbx"
+_QUEUE_SIZE = struct.calcsize(_QUEUE_FMT)
+_NAN = float("nan")
+
+_READ_CHUNK = 2048  # Bytes per read() in read_log()
+
+
+def _pack_time(ts):
+    """Pack a (year, month, day, hour, minute, second) tuple into 32 bits."""
+    if not ts:
+        return 0
+    return (((ts[0] - 2000) & 0x3F) << 26 | ts[1] << 22 | ts[2] << 17 |
+            ts[3] << 12 | ts[4] << 6 | ts[5])
+
+
+def decode_records(data):
+    """Decode binary log data, e.g. a .bin log copied off the device.
+
+    Args:
+        data: bytes read from a .bin log file
+
+    Returns:
+        list: Record dicts with the same keys as the JSON log
+    """
+    records = []
+    for offset in range(0, len(data) - BIN_RECORD_SIZE + 1, BIN_RECORD_SIZE):
+        t, lat, lon, alt, spd, sat, hdop, flags, bat = struct.unpack_from(
+            BIN_RECORD_FMT, data, offset)
+        records.append({
+            'ts': "%04d-%02d-%02dT%02d:%02d:%02d" % (
+                2000 + (t >> 26), (t >> 22) & 0x0F, (t >> 17) & 0x1F,
+                (t >> 12) & 0x1F, (t >> 6) & 0x3F, t & 0x3F),
+            'lat': lat / 1e7,
+            'lon': lon / 1e7,
+            'alt': alt,
+            'spd': spd / 10,
+            'sat': sat,
+            'hdop': hdop / 10,
+            'fix': bool(flags & 0x01),
+            'bat': bat,
+        })
+    return records
+
 
 class DataLogger:
     """Logs GPS data to storage for offline tracking and backup."""
@@ -13,25 +84,56 @@ class DataLogger:
     DEFAULT_LOG_DIR = "/logs"
     MAX_LOG_SIZE = 100000  # Max bytes per log file (100KB)
     MAX_LOG_FILES = 10     # Max number of log files to keep
+    MAX_PENDING = 32       # Max records queued for flush_pending()
+    WRITE_CHUNK = 512      # Queued bytes that trigger a write (one page)
 
-    def __init__(self, log_dir=None, enable_csv=True, enable_json=False):
+    def __init__(self, log_dir=None, enable_csv=True, enable_json=False,
+                 enable_bin=False, enable_compress=False):
         """Initialize data logger.
 
         Args:
             log_dir: Directory for log files (default: /logs)
             enable_csv: Log in CSV format (compact, easy to import)
             enable_json: Log in JSON format (more data, human readable)
+            enable_bin: Log packed binary records (smallest, see decode_records)
+            enable_compress: gzip the CSV/JSON logs (needs the deflate module)
         """
         self.log_dir = log_dir or self.DEFAULT_LOG_DIR
         self.enable_csv = enable_csv
         self.enable_json = enable_json
+        self.enable_bin = enable_bin
+        self.enable_compress = enable_compress and deflate is not None
 
         self._csv_file = None
         self._json_file = None
+        self._bin_file = None
         self._csv_path = None
         self._json_path = None
+        self._bin_path = None
         self._record_count = 0
 
+        # Bytes written to the current CSV log (or binary log without CSV),
+        # checked against MAX_LOG_SIZE for rotation
+        self._log_bytes = 0
+
+        # Ring of packed records (see _QUEUE_FMT) awaiting flush_pending(),
+        # allocated once; formatting is deferred until the records are written
+        self._queue = bytearray(self.MAX_PENDING * _QUEUE_SIZE)
+        self._queue_head = 0
+        self._queued = 0
+        self._pending_since = 0
+        self.dropped = 0
+
+        # Approximate size of one record in the largest enabled log, to
+        # judge when WRITE_CHUNK bytes are queued
+        self._record_bytes = (150 if enable_json else 70 if enable_csv
+                              else BIN_RECORD_SIZE)
+
+        # Last packed GPS time and its formatted string, reused while
+        # records share a fix second
+        self._last_ts = 0
+        self._last_ts_str = None
+
         # Ensure log directory exists
         self._ensure_dir()
 
@@ -59,139 +161,295 @@ class DataLogger:
             # Fallback if RTC not set
             timestamp = f"{time.ticks_ms()}"
 
+        # Compressed text logs get a .gz suffix
+        suffix = ".gz" if self.enable_compress else ""
+        self._log_bytes = 0
+
         if self.enable_csv:
-            self._csv_path = f"{self.log_dir}/gps_{timestamp}.csv"
+            self._csv_path = f"{self.log_dir}/gps_{timestamp}.csv{suffix}"
             try:
-                self._csv_file = open(self._csv_path, 'w')
+                self._csv_file = self._open_text_log(self._csv_path)
                 # Write CSV header
-                self._csv_file.write("timestamp,latitude,longitude,altitude,speed,heading,satellites,hdop,valid,battery\n")
-                self._csv_file.flush()
+                self._csv_file.write(CSV_HEADER)
+                self._log_bytes = len(CSV_HEADER)
+                if not self.enable_compress:
+                    self._csv_file.flush()
             except OSError as e:
                 print(f"Failed to open CSV log: {e}")
                 self._csv_file = None
 
         if self.enable_json:
-            self._json_path = f"{self.log_dir}/gps_{timestamp}.jsonl"
+            self._json_path = f"{self.log_dir}/gps_{timestamp}.jsonl{suffix}"
             try:
-                self._json_file = open(self._json_path, 'w')
+                self._json_file = self._open_text_log(self._json_path)
             except OSError as e:
                 print(f"Failed to open JSON log: {e}")
                 self._json_file = None
 
+        if self.enable_bin:
+            self._bin_path = f"{self.log_dir}/gps_{timestamp}.bin"
+            try:
+                self._bin_file = open(self._bin_path, 'wb')
+            except OSError as e:
+                print(f"Failed to open binary log: {e}")
+                self._bin_file = None
+
+    def _open_text_log(self, path):
+        """Open a CSV/JSON log for writing, as a gzip stream if compressing.
+
+        DeflateIO has no flush(); compressed data reaches the file as the
+        compressor emits it and the gzip trailer is written on close().
+        The main loop closes the logs before a reboot or deep sleep, but a
+        watchdog reset or power loss still leaves the current .gz log
+        truncated and unreadable.
+        """
+        if self.enable_compress:
+            return deflate.DeflateIO(open(path, 'wb'), deflate.GZIP, 0, True)
+        return open(path, 'w')
+
     def log(self, gps_data, device_status=None):
-        """Log a GPS position record.
+        """Queue a GPS position record.
+
+        The record is packed into the in-RAM queue and only formatted and
+        written to storage by flush_pending(), so the caller never waits on
+        flash or SD writes. When MAX_PENDING records are queued the oldest
+        is dropped.
 
         Args:
             gps_data: dict with GPS data from GPSDriver.get_position()
             device_status: dict with device status (optional)
 
         Returns:
-            bool: True if logged successfully
+            bool: True if the record was queued
         """
-        success = True
-
-        # Build timestamp string
-        ts = gps_data.get('timestamp')
-        if ts:
-            ts_str = f"{ts[0]:04d}-{ts[1]:02d}-{ts[2]:02d}T{ts[3]:02d}:{ts[4]:02d}:{ts[5]:02d}"
-        else:
-            ts_str = str(time.ticks_ms())
+        if not (self._csv_file or self._json_file or self._bin_file):
+            return False
 
-        # Get battery level
+        get = gps_data.get
+        ts = get('timestamp')
+        heading = get('heading')
         battery = device_status.get('battery', -1) if device_status else -1
 
-        # Log to CSV
-        if self._csv_file:
+        if self._queued == self.MAX_PENDING:
+            # Drop the oldest record to make room
+            self._queue_head = (self._queue_head + 1) % self.MAX_PENDING
+            self._queued -= 1
+            self.dropped += 1
+        count = self._queued
+        slot = (self._queue_head + count) % self.MAX_PENDING
+        try:
+            struct.pack_into(
+                _QUEUE_FMT, self._queue, slot * _QUEUE_SIZE,
+                _pack_time(ts) if ts and ts[0] else 0,
+                time.ticks_ms(),
+                get('latitude', 0.0),
+                get('longitude', 0.0),
+                get('altitude', 0.0),
+                get('speed', 0.0),
+                _NAN if heading is None else heading,
+                get('hdop', 99.9),
+                min(255, get('satellites', 0)),
+                1 if get('valid', False) else 0,
+                max(-1, min(127, battery)))
+        except Exception as e:
+            print(f"Log error: {e}")
+            return False
+
+        if not count:
+            self._pending_since = time.ticks_ms()
+        self._queued = count + 1
+        return True
+
+    def flush_pending(self, max_age_ms=0):
+        """Format queued records and write them to storage.
+
+        Records are held until about WRITE_CHUNK bytes are queued or the
+        oldest is max_age_ms old, then written with one write and one flush
+        per file, so storage sees page-sized writes rather than single lines.
+
+        Args:
+            max_age_ms: Hold younger records below WRITE_CHUNK (0 = write now)
+
+        Returns:
+            int: Number of records written
+        """
+        count = self._queued
+        if not count:
+            return 0
+        if (count * self._record_bytes < self.WRITE_CHUNK and
+                time.ticks_diff(time.ticks_ms(), self._pending_since) < max_age_ms):
+            return 0
+
+        csv_file = self._csv_file
+        json_file = self._json_file
+        bin_file = self._bin_file
+        csv_lines = []
+        json_lines = []
+        bin_records = []
+
+        queue = self._queue
+        slot = self._queue_head
+        last_t = self._last_ts
+        last_str = self._last_ts_str
+        for _ in range(count):
+            (t, ticks, lat, lon, alt, speed, heading, hdop, sats, flags,
+             battery) = struct.unpack_from(_QUEUE_FMT, queue, slot * _QUEUE_SIZE)
+            slot = (slot + 1) % self.MAX_PENDING
+            valid = flags & 0x01
+
+            # Consecutive records often share a fix second
+            if not t:
+                ts_str = str(ticks)
+            else:
+                if t != last_t:
+                    last_t = t
+                    last_str = _TS_FMT % (
+                        2000 + (t >> 26), (t >> 22) & 0x0F, (t >> 17) & 0x1F,
+                        (t >> 12) & 0x1F, (t >> 6) & 0x3F, t & 0x3F)
+                ts_str = last_str
+            # NaN is the only value not equal to itself
+            hdg = None if heading != heading else "%.1f" % heading
+
+            if csv_file:
+                try:
+                    csv_lines.append(_CSV_FMT % (
+                        ts_str, lat, lon, alt, speed, hdg or "",
+                        sats, hdop, valid, battery))
+                except Exception as e:
+                    print(f"CSV log error: {e}")
+
+            if json_file:
+                try:
+                    json_lines.append(_JSON_FMT % (
+                        ts_str, lat, lon, alt, speed, hdg or "null",
+                        sats, hdop, "true" if valid else "false", battery))
+                except Exception as e:
+                    print(f"JSON log error: {e}")
+
+            if bin_file:
+                try:
+                    bin_records.append(struct.pack(
+                        BIN_RECORD_FMT, t,
+                        int(lat * 1e7),
+                        int(lon * 1e7),
+                        max(-32768, min(32767, int(alt))),
+                        min(65535, int(speed * 10)),
+                        sats,
+                        min(255, int(hdop * 10)),
+                        valid,
+                        battery))
+                except Exception as e:
+                    print(f"Binary log error: {e}")
+
+        self._last_ts = last_t
+        self._last_ts_str = last_str
+        self._queue_head = slot
+        self._queued = 0
+
+        flush_text = not self.enable_compress
+
+        if csv_file:
             try:
-                lat = gps_data.get('latitude', 0.0)
-                lon = gps_data.get('longitude', 0.0)
-                alt = gps_data.get('altitude', 0.0)
-                speed = gps_data.get('speed', 0.0)
-                heading = gps_data.get('heading')
-                heading_str = f"{heading:.1f}" if heading is not None else ""
-                sats = gps_data.get('satellites', 0)
-                hdop = gps_data.get('hdop', 99.9)
-                valid = 1 if gps_data.get('valid', False) else 0
-
-                line = f"{ts_str},{lat:.6f},{lon:.6f},{alt:.1f},{speed:.1f},{heading_str},{sats},{hdop:.1f},{valid},{battery}\n"
-                self._csv_file.write(line)
-                self._csv_file.flush()
+                data = "".join(csv_lines)
+                csv_file.write(data)
+                self._log_bytes += len(data)
+                if flush_text:
+                    csv_file.flush()
             except Exception as e:
                 print(f"CSV log error: {e}")
-                success = False
 
-        # Log to JSON Lines
-        if self._json_file:
+        if json_file:
             try:
-                record = {
-                    'ts': ts_str,
-                    'lat': gps_data.get('latitude', 0.0),
-                    'lon': gps_data.get('longitude', 0.0),
-                    'alt': gps_data.get('altitude', 0.0),
-                    'spd': gps_data.get('speed', 0.0),
-                    'hdg': gps_data.get('heading'),
-                    'sat': gps_data.get('satellites', 0),
-                    'hdop': gps_data.get('hdop', 99.9),
-                    'fix': gps_data.get('valid', False),
-                    'bat': battery
-                }
-                self._json_file.write(json.dumps(record) + '\n')
-                self._json_file.flush()
+                json_file.write("".join(json_lines))
+                if flush_text:
+                    json_file.flush()
             except Exception as e:
                 print(f"JSON log error: {e}")
-                success = False
 
-        self._record_count += 1
+        if bin_file:
+            try:
+                data = b"".join(bin_records)
+                bin_file.write(data)
+                if not csv_file:
+                    self._log_bytes += len(data)
+                bin_file.flush()
+            except Exception as e:
+                print(f"Binary log error: {e}")
+
+        self._record_count += count
 
         # Check if rotation needed
         self._check_rotation()
 
-        return success
+        return count
 
     def _check_rotation(self):
-        """Check if log files need rotation."""
-        needs_rotation = False
-
-        if self._csv_file and self._csv_path:
-            try:
-                size = os.stat(self._csv_path)[6]
-                if size > self.MAX_LOG_SIZE:
-                    needs_rotation = True
-            except OSError:
-                pass
+        """Check if log files need rotation.
 
-        if needs_rotation:
+        Uses the running _log_bytes count rather than stat()ing the file.
+        For compressed logs this is the uncompressed size.
+        """
+        if self._log_bytes > self.MAX_LOG_SIZE:
             self.close()
-            self._cleanup_old_logs()
             self._open_logs()
+            self._cleanup_old_logs()
 
     def _cleanup_old_logs(self):
-        """Remove old log files if too many exist."""
-        try:
-            files = os.listdir(self.log_dir)
-            csv_files = sorted([f for f in files if f.endswith('.csv')])
-            json_files = sorted([f for f in files if f.endswith('.jsonl')])
+        """Remove old log files if too many exist.
 
-            # Remove oldest files if over limit
-            while len(csv_files) > self.MAX_LOG_FILES:
-                oldest = csv_files.pop(0)
+        One pass over the directory groups logs by suffix; only a group
+        over its limit is sorted to find the oldest files.
+        """
+        # Compressed CSV and JSON logs share the .gz suffix
+        limit = self.MAX_LOG_FILES
+        groups = {'.csv': [], '.jsonl': [], '.bin': [], '.gz': []}
+        try:
+            for f in os.listdir(self.log_dir):
+                group = groups.get(f[f.rfind('.'):])
+                if group is not None:
+                    group.append(f)
+        except OSError:
+            return
+
+        for suffix, files in groups.items():
+            excess = len(files) - (limit * 2 if suffix == '.gz' else limit)
+            if excess <= 0:
+                continue
+            # Remove oldest files if over limit, never the logs currently
+            # open for writing (counted, but skipped)
+            current = [p[p.rfind('/') + 1:] for p in
+                       (self._csv_path, self._json_path, self._bin_path) if p]
+            files.sort()
+            for oldest in [f for f in files if f not in current][:excess]:
                 try:
                     os.remove(f"{self.log_dir}/{oldest}")
                 except OSError:
                     pass
 
-            while len(json_files) > self.MAX_LOG_FILES:
-                oldest = json_files.pop(0)
-                try:
-                    os.remove(f"{self.log_dir}/{oldest}")
-                except OSError:
-                    pass
+    def sync(self):
+        """Write queued records and commit them to storage.
 
-        except OSError:
+        log() never syncs. For plain CSV/JSON and binary logs this makes
+        every record logged so far durable.
+
+        With log_compress on this does nothing useful for the CSV/JSON
+        logs: DeflateIO has no flush(), so records handed to it may stay
+        buffered in the compressor, and the .gz file is unreadable until
+        close() writes the gzip trailer. Use close() before a reset or
+        deep sleep instead.
+        """
+        self.flush_pending()
+        try:
+            os.sync()
+        except AttributeError:
+            # Port without os.sync(); flush() has already committed files
             pass
 
     def close(self):
-        """Close log files."""
+        """Write any queued records and close log files."""
+        if self._queued:
+            self.flush_pending()
+
         if self._csv_file:
             try:
                 self._csv_file.close()
@@ -206,6 +464,13 @@ class DataLogger:
                 pass
             self._json_file = None
 
+        if self._bin_file:
+            try:
+                self._bin_file.close()
+            except Exception:
+                pass
+            self._bin_file = None
+
     def get_log_files(self):
         """Get list of log files.
 
@@ -215,14 +480,130 @@ class DataLogger:
         try:
             files = os.listdir(self.log_dir)
             return [f"{self.log_dir}/{f}" for f in files
-                    if f.endswith('.csv') or f.endswith('.jsonl')]
+                    if f.endswith('.csv') or f.endswith('.jsonl') or
+                    f.endswith('.bin') or f.endswith('.gz')]
         except OSError:
             return []
 
+    def erase_all(self):
+        """Delete all log files and start fresh ones."""
+        self._queued = 0
+        self.close()
+
+        # One ilistdir scan yields only existing entries and their type, so
+        # nothing is removed blindly and the except below stays off the
+        # normal path
+        prefix = self.log_dir + "/"
+        remove = os.remove
+        try:
+            entries = os.ilistdir(self.log_dir)
+        except AttributeError:
+            # Host Python: no ilistdir, every listed log is a regular file
+            entries = [(name, 0x8000) for name in os.listdir(self.log_dir)]
+        except OSError:
+            entries = ()
+
+        for entry in entries:
+            name = entry[0]
+            if entry[1] != 0x8000:
+                continue
+            if not (name.endswith('.csv') or name.endswith('.jsonl') or
+                    name.endswith('.bin') or name.endswith('.gz')):
+                continue
+            try:
+                remove(prefix + name)
+            except OSError:
+                pass
+
+        self._open_logs()
+
     def get_record_count(self):
         """Get number of records logged in current session."""
         return self._record_count
 
+    def _iter_lines(self, filepath, max_lines):
+        """Yield up to max_lines lines of a CSV/JSON log, plain or gzip.
+
+        Reads in _READ_CHUNK pieces rather than one readline() per record;
+        the last piece of each chunk may be a partial line and is carried
+        into the next. Blank lines are skipped.
+        """
+        compressed = filepath.endswith('.gz')
+        if compressed and deflate is None:
+            return
+        try:
+            if compressed:
+                f = deflate.DeflateIO(open(filepath, 'rb'), deflate.GZIP, 0, True)
+            else:
+                f = open(filepath, 'r')
+            with f:
+                tail = ""
+                while max_lines > 0:
+                    data = f.read(_READ_CHUNK)
+                    if not data:
+                        if tail:
+                            yield tail
+                        return
+                    if compressed:
+                        data = data.decode()
+                    lines = (tail + data).split("\n")
+                    tail = lines.pop()
+                    for line in lines:
+                        if line:
+                            yield line
+                            max_lines -= 1
+                            if not max_lines:
+                                return
+        except OSError as e:
+            print(f"Error reading log: {e}")
+
+    def iter_log(self, filepath, max_records=100):
+        """Yield records from a log file one at a time.
+
+        Only one read chunk is held in memory, so long logs can be walked
+        without building a list.
+
+        Args:
+            filepath: Path to log file
+            max_records: Maximum records to yield
+
+        Yields:
+            Record dicts (for JSON and binary) or strings (for CSV)
+        """
+        if filepath.endswith('.bin'):
+            per_read = max(1, _READ_CHUNK // BIN_RECORD_SIZE)
+            try:
+                with open(filepath, 'rb') as f:
+                    while max_records > 0:
+                        n = min(per_read, max_records)
+                        records = decode_records(f.read(n * BIN_RECORD_SIZE))
+                        if not records:
+                            return
+                        max_records -= len(records)
+                        for record in records:
+                            yield record
+            except OSError as e:
+                print(f"Error reading log: {e}")
+            return
+
+        # CSV logs start with a header line
+        is_csv = filepath.endswith('.csv') or filepath.endswith('.csv.gz')
+        lines = self._iter_lines(filepath, max_records + (1 if is_csv else 0))
+        if is_csv:
+            for _ in lines:
+                break
+
+        if filepath.endswith('.jsonl') or filepath.endswith('.jsonl.gz'):
+            for line in lines:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Damaged record, e.g. cut short by power loss
+                    pass
+        else:
+            for line in lines:
+                yield line.strip()
+
     def read_log(self, filepath, max_records=100):
         """Read records from a log file.
 
@@ -231,27 +612,18 @@ class DataLogger:
             max_records: Maximum records to return
 
         Returns:
-            list: List of record dicts (for JSON) or strings (for CSV)
+            list: List of record dicts (for JSON and binary) or strings (for CSV)
         """
-        records = []
-        try:
-            with open(filepath, 'r') as f:
-                for i, line in enumerate(f):
-                    if i == 0 and filepath.endswith('.csv'):
-                        continue  # Skip CSV header
-                    if i >= max_records:
-                        break
-                    if filepath.endswith('.jsonl'):
-                        try:
-                            records.append(json.loads(line))
-                        except ValueError:
-                            pass
-                    else:
-                        records.append(line.strip())
-        except OSError as e:
-            print(f"Error reading log: {e}")
+        if not (filepath.endswith('.jsonl') or filepath.endswith('.jsonl.gz')):
+            return list(self.iter_log(filepath, max_records))
 
-        return records
+        # Parse every JSON record in one json.loads() call, falling back to
+        # one at a time (skipping damaged records) if that fails
+        lines = list(self._iter_lines(filepath, max_records))
+        try:
+            return json.loads("[" + ",".join(lines) + "]")
+        except ValueError:
+            return list(self.iter_log(filepath, max_records))
 
     def get_storage_info(self):
         """Get storage usage information.
@@ -10,8 +10,62 @@
 #   Error: Red solid/flash
 
 from machine import Pin, Timer
+import sys
 import time
 
+try:
+    import rp2
+except ImportError:
+    # Not an RP2040 port - blink from a Timer callback instead
+    rp2 = None
+
+# SIO GPIO_OUT_SET / GPIO_OUT_CLR: each store atomically sets or clears
+# the given output bits, leaving every other GPIO alone. The offsets
+# differ between the RP2040 and the RP2350
+if "RP2350" in getattr(sys.implementation, "_machine", ""):
+    _SIO_GPIO_OUT_SET = 0xd0000018
+    _SIO_GPIO_OUT_CLR = 0xd0000020
+else:
+    _SIO_GPIO_OUT_SET = 0xd0000014
+    _SIO_GPIO_OUT_CLR = 0xd0000018
+
+# PIO0 SM0. Nothing else in this firmware uses PIO, but on the Pico W the
+# CYW43 WiFi driver runs its SPI bus on PIO1, and taking one of its state
+# machines does not raise - it silently breaks WiFi. Keep this on PIO0
+_BLINK_SM_ID = 0
+_BLINK_SM_FREQ = 2000  # PIO clock for blinking (2 cycles per ms)
+
+
+def _blink_body():
+    # Half-period in cycles arrives once through the TX FIFO
+    pull(block)
+    mov(y, osr)
+    wrap_target()
+    set(pins, 3)
+    mov(x, y)
+    label("on")
+    jmp(x_dec, "on")
+    set(pins, 0)
+    mov(x, y)
+    label("off")
+    jmp(x_dec, "off")
+    wrap()
+
+
+if rp2:
+    import micropython
+
+    @micropython.viper
+    def _sio_write(clear: uint, bits: uint):
+        """Clear then set GPIO output bits, one atomic store each."""
+        ptr32(_SIO_GPIO_OUT_CLR)[0] = clear
+        ptr32(_SIO_GPIO_OUT_SET)[0] = bits
+
+    # One program per pin count; set(pins, 3) drives every pin in the group
+    _BLINK_ONE = rp2.asm_pio(set_init=rp2.PIO.OUT_LOW)(_blink_body)
+    _BLINK_TWO = rp2.asm_pio(
+        set_init=(rp2.PIO.OUT_LOW, rp2.PIO.OUT_LOW))(_blink_body)
+
 
 class StatusLED:
     """Controls status LEDs for visual feedback.
@@ -46,20 +100,80 @@ class StatusLED:
         except Exception:
             self.led_onboard = None
 
-        # Blink timers
-        self._blink_timer = None
+        # On rp2 the three colour LEDs are written together through the SIO
+        # clear and set registers; 0 mask = write each Pin in turn
+        self._rgb_mask = 0
+        if rp2 and all(isinstance(p, int) and p
+                       for p in (gps_pin, network_pin, error_pin)):
+            self._rgb_bits = (1 << gps_pin, 1 << network_pin, 1 << error_pin)
+            self._rgb_mask = sum(self._rgb_bits)
+
+        # Colours for _apply_rgb(), precomputed once. update_gps_status()
+        # indexes _gps_patterns by status: 0 = no GPS (green and red off,
+        # blue left to the network status), 1 = cyan, 2 = purple
+        self._rgb_off = self._rgb_pattern(False, False, False)
+        self._rgb_on = self._rgb_pattern(True, True, True)
+        self._cyan = self._rgb_pattern(True, True, False)
+        self._purple = self._rgb_pattern(False, True, True)
+        self._gps_patterns = (self._rgb_pattern(False, None, False),
+                              self._cyan, self._purple)
+
+        # Cyan blinks on one PIO state machine when green and blue are
+        # adjacent GPIOs (set_base covers consecutive pins only)
+        self._cyan_pio = (rp2 is not None and isinstance(gps_pin, int) and
+                          network_pin == gps_pin + 1)
+
+        # Blink timer, created once and re-armed with init() for each blink
+        # (or PIO state machine, which needs no CPU wakeups)
+        self._blink_timer = Timer()
+        self._timer_running = False
+        self._blink_sm = None
         self._blink_led = None
         self._blink_state = False
         self._multi_blink_leds = []
 
+        # Last pattern shown by update_gps_status(), or None once any
+        # other call has changed the LEDs
+        self._gps_status = None
+
         # Turn all LEDs off initially
         self.all_off()
 
     def _set_led(self, led, state):
         """Set LED state safely."""
+        self._gps_status = None
         if led:
             led.value(1 if state else 0)
 
+    def _rgb_pattern(self, gps, network, error):
+        """Build a colour for _apply_rgb() (None leaves that LED as is).
+
+        Returns (SIO bits to clear, SIO bits to set) on rp2, else a tuple
+        of (Pin, value) pairs.
+        """
+        states = (gps, network, error)
+        if self._rgb_mask:
+            mask = bits = 0
+            for state, bit in zip(states, self._rgb_bits):
+                if state is not None:
+                    mask |= bit
+                    if state:
+                        bits |= bit
+            return mask & ~bits, bits
+        leds = (self.led_gps, self.led_network, self.led_error)
+        return tuple((led, 1 if state else 0)
+                     for state, led in zip(states, leds)
+                     if led and state is not None)
+
+    def _apply_rgb(self, pattern):
+        """Show a colour from _rgb_pattern() in one update."""
+        self._gps_status = None
+        if self._rgb_mask:
+            _sio_write(pattern[0], pattern[1])
+        else:
+            for led, value in pattern:
+                led.value(value)
+
     def gps_on(self):
         """Turn GPS LED on (indicates fix)."""
         self._set_led(self.led_gps, True)
@@ -112,17 +226,13 @@ class StatusLED:
     def all_off(self):
         """Turn all LEDs off."""
         self._stop_blink()
-        self._set_led(self.led_gps, False)
-        self._set_led(self.led_network, False)
-        self._set_led(self.led_error, False)
+        self._apply_rgb(self._rgb_off)
         self._set_led(self.led_onboard, False)
 
     def all_on(self):
         """Turn all LEDs on (for testing)."""
         self._stop_blink()
-        self._set_led(self.led_gps, True)
-        self._set_led(self.led_network, True)
-        self._set_led(self.led_error, True)
+        self._apply_rgb(self._rgb_on)
         self._set_led(self.led_onboard, True)
 
     def _blink_callback(self, timer):
@@ -143,16 +253,44 @@ class StatusLED:
         if led:
             self._blink_led = led
             self._blink_state = False
-            self._blink_timer = Timer()
+            if rp2 and self._start_pio_blink(_BLINK_ONE, led, period_ms):
+                return
             self._blink_timer.init(period=period_ms // 2,
                                    mode=Timer.PERIODIC,
                                    callback=self._blink_callback)
+            self._timer_running = True
+
+    def _start_pio_blink(self, prog, base, period_ms):
+        """Blink pins from base on a PIO state machine.
+
+        Returns:
+            bool: True if the state machine is running
+        """
+        try:
+            sm = rp2.StateMachine(_BLINK_SM_ID, prog, freq=_BLINK_SM_FREQ,
+                                  set_base=base)
+            # Loop overhead is 3 cycles per half-period
+            sm.put(max(0, period_ms - 3))
+            sm.active(1)
+        except Exception:
+            return False
+        self._blink_sm = sm
+        return True
 
     def _stop_blink(self):
         """Stop any blinking LED."""
-        if self._blink_timer:
+        self._gps_status = None
+        if self._timer_running:
             self._blink_timer.deinit()
-            self._blink_timer = None
+            self._timer_running = False
+        if self._blink_sm:
+            self._blink_sm.active(0)
+            self._blink_sm = None
+            # Hand the pins back from PIO to normal GPIO output
+            for led in [self._blink_led] + self._multi_blink_leds:
+                if led:
+                    led.init(Pin.OUT)
+                    led.value(0)
         if self._blink_led:
             self._blink_led.value(0)
             self._blink_led = None
@@ -193,9 +331,7 @@ class StatusLED:
         RAPID 2: Indicates GPS acquiring satellites.
         """
         self._stop_blink()
-        self._set_led(self.led_gps, True)      # Green
-        self._set_led(self.led_network, True)  # Blue
-        self._set_led(self.led_error, False)   # Red off
+        self._apply_rgb(self._cyan)
 
     def set_purple(self):
         """Set LEDs to purple (red + blue).
@@ -203,9 +339,7 @@ class StatusLED:
         RAPID 2: Indicates GPS has fix.
         """
         self._stop_blink()
-        self._set_led(self.led_gps, False)     # Green off
-        self._set_led(self.led_network, True)  # Blue
-        self._set_led(self.led_error, True)    # Red
+        self._apply_rgb(self._purple)
 
     def blink_cyan(self, period_ms=500):
         """Blink cyan (green + blue together).
@@ -220,12 +354,15 @@ class StatusLED:
         self._stop_blink()
         if self._multi_blink_leds:
             self._blink_state = False
-            self._blink_timer = Timer()
+            if (self._cyan_pio and self._start_pio_blink(
+                    _BLINK_TWO, self.led_gps, period_ms)):
+                return
             self._blink_timer.init(
                 period=period_ms // 2,
                 mode=Timer.PERIODIC,
                 callback=self._multi_blink_callback
             )
+            self._timer_running = True
 
     def _multi_blink_callback(self, timer):
         """Timer callback for blinking multiple LEDs."""
@@ -236,6 +373,7 @@ class StatusLED:
 
     def indicate_transmit(self):
         """Flash to indicate transmission."""
+        self._gps_status = None
         if self.led_network:
             for _ in range(2):
                 self.led_network.value(1)
@@ -249,6 +387,7 @@ class StatusLED:
         Args:
             count: Number of flashes
         """
+        self._gps_status = None
         if self.led_error:
             for _ in range(count):
                 self.led_error.value(1)
@@ -268,19 +407,14 @@ class StatusLED:
             has_fix: True if GPS has a fix
             acquiring: True if currently acquiring satellites
         """
+        status = 2 if has_fix else 1 if acquiring else 0
+        if status == self._gps_status:
+            return  # LEDs already show this pattern
+
         self._stop_blink()
         self._multi_blink_leds = []
-
-        if has_fix:
-            # Purple = GPS has fix
-            self.set_purple()
-        elif acquiring:
-            # Cyan = GPS acquiring
-            self.set_cyan()
-        else:
-            # No GPS activity
-            self._set_led(self.led_gps, False)
-            self._set_led(self.led_error, False)
+        self._apply_rgb(self._gps_patterns[status])
+        self._gps_status = status
 
     def update_network_status(self, connected, connecting=False):
         """Update network LED based on status.
@@ -295,7 +429,7 @@ class StatusLED:
             connecting: True if currently connecting
         """
         # Don't stop GPS-related LED states
-        if self._blink_timer and self._multi_blink_leds:
+        if (self._timer_running or self._blink_sm) and self._multi_blink_leds:
             return  # GPS is using the LEDs
 
         if connected:
@@ -1,7 +1,9 @@
 # Simple Logger for Pico Beacon
 # Provides debug output with configurable levels
 
+import sys
 import time
+from binascii import hexlify
 
 
 class LogLevel:
@@ -13,14 +15,24 @@ class LogLevel:
     NONE = 99
 
 
+# Output templates; level tags below are pre-padded to 5 characters
+_FMT_TS = "[%6d.%03d] [%s] %s: %s\n"
+_FMT = "[%s] %s: %s\n"
+
+_TAG_DEBUG = "DEBUG"
+_TAG_INFO = "INFO "
+_TAG_WARN = "WARN "
+_TAG_ERROR = "ERROR"
+
+
 class Logger:
     """Simple logger with level filtering."""
 
-    LEVEL_NAMES = {
-        LogLevel.DEBUG: "DEBUG",
-        LogLevel.INFO: "INFO",
-        LogLevel.WARNING: "WARN",
-        LogLevel.ERROR: "ERROR"
+    LEVEL_TAGS = {
+        LogLevel.DEBUG: _TAG_DEBUG,
+        LogLevel.INFO: _TAG_INFO,
+        LogLevel.WARNING: _TAG_WARN,
+        LogLevel.ERROR: _TAG_ERROR
     }
 
     def __init__(self, name="Beacon", level=LogLevel.INFO, enable_timestamp=True):
@@ -34,42 +46,49 @@ class Logger:
         self.name = name
         self.level = level
         self.enable_timestamp = enable_timestamp
+        # Lines are written whole, skipping print()'s sep/end handling
+        self._write = sys.stdout.write
 
-    def _log(self, level, message):
-        """Internal log method."""
-        if level < self.level:
-            return
+    def _log(self, tag, message, args=()):
+        """Internal log method.
 
-        level_name = self.LEVEL_NAMES.get(level, "?")
+        Callers check the level first, and %-style args are only formatted
+        here, so filtered messages cost no call or string allocation.
+        """
+        if args:
+            message = message % args
 
         if self.enable_timestamp:
             # Get timestamp (milliseconds since boot)
             ts = time.ticks_ms()
-            secs = ts // 1000
-            ms = ts % 1000
-            print(f"[{secs:6d}.{ms:03d}] [{level_name:5s}] {self.name}: {message}")
+            self._write(_FMT_TS % (ts // 1000, ts % 1000, tag, self.name, message))
         else:
-            print(f"[{level_name:5s}] {self.name}: {message}")
+            self._write(_FMT % (tag, self.name, message))
 
-    def debug(self, message):
+    def debug(self, message, *args):
         """Log debug message."""
-        self._log(LogLevel.DEBUG, message)
+        if self.level <= LogLevel.DEBUG:
+            self._log(_TAG_DEBUG, message, args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """Log info message."""
-        self._log(LogLevel.INFO, message)
+        if self.level <= LogLevel.INFO:
+            self._log(_TAG_INFO, message, args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning message."""
-        self._log(LogLevel.WARNING, message)
+        if self.level <= LogLevel.WARNING:
+            self._log(_TAG_WARN, message, args)
 
-    def warn(self, message):
+    def warn(self, message, *args):
         """Alias for warning()."""
-        self.warning(message)
+        if self.level <= LogLevel.WARNING:
+            self._log(_TAG_WARN, message, args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """Log error message."""
-        self._log(LogLevel.ERROR, message)
+        if self.level <= LogLevel.ERROR:
+            self._log(_TAG_ERROR, message, args)
 
     def set_level(self, level):
         """Set minimum log level.
@@ -89,8 +108,8 @@ class Logger:
         if self.level > LogLevel.DEBUG:
             return
 
-        hex_str = ' '.join(f'{b:02X}' for b in data)
-        self._log(LogLevel.DEBUG, f"{message} ({len(data)} bytes): {hex_str}")
+        hex_str = hexlify(data, ' ').decode().upper()
+        self._log(_TAG_DEBUG, "%s (%d bytes): %s", (message, len(data), hex_str))
 
 
 # Global default logger instance
@@ -20,6 +20,9 @@ class PowerManager:
     BATTERY_EMPTY = 3.0
     BATTERY_LOW_THRESHOLD = 3.4
 
+    # Report intervals longer than this use deep sleep when it is allowed
+    DEEP_SLEEP_MIN_MS = 30000
+
     def __init__(self, battery_adc_pin=26, gps_enable_pin=None, cell_enable_pin=None):
         """Initialize power manager.
 
@@ -159,6 +162,18 @@ class PowerManager:
         deepsleep(duration_ms)
         # Note: Code after this won't execute - device resets on wake
 
+    def uses_deep_sleep(self, interval_sec, allow_deep_sleep=False):
+        """Check whether sleep_until_next_report() would deep sleep.
+
+        Args:
+            interval_sec: Reporting interval in seconds
+            allow_deep_sleep: If True, use deep sleep for long intervals
+
+        Returns:
+            bool: True if the sleep will reset the device
+        """
+        return allow_deep_sleep and interval_sec * 1000 > self.DEEP_SLEEP_MIN_MS
+
     def sleep_until_next_report(self, interval_sec, allow_deep_sleep=False):
         """Sleep until next reporting interval.
 
@@ -173,7 +188,7 @@ class PowerManager:
         """
         duration_ms = interval_sec * 1000
 
-        if allow_deep_sleep and duration_ms > 30000:
+        if self.uses_deep_sleep(interval_sec, allow_deep_sleep):
             # Use deep sleep for long intervals
             # Disable peripherals first
             self.disable_all_peripherals()